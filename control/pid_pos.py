@@ -3,8 +3,37 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-def _clamp(v: float, lo: float, hi: float) -> float:
-    return hi if v > hi else lo if v < lo else v
+def pid_axis_step(
+    e: float,
+    d: float,
+    i_prev: float,
+    kp: float,
+    ki: float,
+    kd: float,
+    i_limit: float,
+    accel_max: float,
+    dt: float,
+) -> tuple[float, float]:
+    """One PID axis with conditional integration and output clamp -> (u, i_new)."""
+    # Candidate integrator (clamped)
+    if ki > 0.0:
+        i_cand = min(max(i_prev + e * dt, -i_limit), i_limit)
+    else:
+        i_cand = 0.0
+
+    u_unsat = kp * e + ki * i_cand + kd * d
+    u_sat = min(max(u_unsat, -accel_max), accel_max)
+
+    # If saturated, only integrate when it helps drive us out of saturation.
+    if u_unsat != u_sat and ki > 0.0:
+        # keep previous integrator this step (conditional integration)
+        i_new = i_prev
+        u_unsat = kp * e + ki * i_new + kd * d
+        u_sat = min(max(u_unsat, -accel_max), accel_max)
+    else:
+        i_new = i_cand
+
+    return u_sat, i_new
 
 
 @dataclass
@@ -47,25 +76,9 @@ class PIDPos2D:
         self, e: float, d: float, i_prev: float, g: PIDGains, dt: float
     ) -> tuple[float, float]:
         """One PID axis with conditional integration and output clamp."""
-        # Candidate integrator (clamped)
-        if g.ki > 0.0:
-            i_cand = _clamp(i_prev + e * dt, -self.lim.i_limit, self.lim.i_limit)
-        else:
-            i_cand = 0.0
-
-        u_unsat = g.kp * e + g.ki * i_cand + g.kd * d
-        u_sat = _clamp(u_unsat, -self.lim.accel_max, self.lim.accel_max)
-
-        # If saturated, only integrate when it helps drive us out of saturation.
-        if u_unsat != u_sat and g.ki > 0.0:
-            # keep previous integrator this step (conditional integration)
-            i_new = i_prev
-            u_unsat = g.kp * e + g.ki * i_new + g.kd * d
-            u_sat = _clamp(u_unsat, -self.lim.accel_max, self.lim.accel_max)
-        else:
-            i_new = i_cand
-
-        return u_sat, i_new
+        return pid_axis_step(
+            e, d, i_prev, g.kp, g.ki, g.kd, self.lim.i_limit, self.lim.accel_max, dt
+        )
 
     def step(
         self,
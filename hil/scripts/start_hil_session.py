@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import argparse
 import json
 import random
 import time
@@ -16,13 +17,14 @@ OUT_DIR.mkdir(parents=True, exist_ok=True)
 
 
 def run_mock(secs: float = 6.0, imu_hz: int = 400, gps_hz: int = 10, seed: int = 7):
-    random.seed(seed)
+    # same stream as random.seed(seed), without reseeding the global generator
+    rng = random.Random(seed)
     start = time.time()
     t_imu = 1.0 / imu_hz
     t_gps = 1.0 / gps_hz
     next_gps = start
     # biases: ~0.02 g on X/Y, +1g on Z (gravity), tiny noise
-    bx = 0.02 * (1 if random.random() < 0.5 else -1)
+    bx = 0.02 * (1 if rng.random() < 0.5 else -1)
     by = -0.02
     bz = 1.0  # include gravity magnitude as "accel z"
     gps_latency_ms = []
@@ -34,20 +36,20 @@ def run_mock(secs: float = 6.0, imu_hz: int = 400, gps_hz: int = 10, seed: int =
         while t - start < secs:
             # IMU sample
             n = 0.005
-            ax = bx + random.uniform(-n, n)
-            ay = by + random.uniform(-n, n)
-            az = bz + random.uniform(-n, n)
+            ax = bx + rng.uniform(-n, n)
+            ay = by + rng.uniform(-n, n)
+            az = bz + rng.uniform(-n, n)
             gps_fix = 0
             gps_ts = ""
 
             # GPS tick?
             if t >= next_gps:
                 # 2% drop
-                if random.random() < 0.02:
+                if rng.random() < 0.02:
                     dropped_gps += 1
                 else:
                     # latency ~ 5–20 ms
-                    lat_ms = random.uniform(5.0, 20.0)
+                    lat_ms = rng.uniform(5.0, 20.0)
                     gps_latency_ms.append(lat_ms)
                     gps_fix = 1
                     gps_ts = f"{(t + lat_ms/1000.0):.6f}"
@@ -67,5 +69,16 @@ def run_mock(secs: float = 6.0, imu_hz: int = 400, gps_hz: int = 10, seed: int =
     print(json.dumps(kpis))
 
 
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Mock HIL session (IMU + GPS log and KPIs)")
+    ap.add_argument("--secs", type=float, default=6.0)
+    ap.add_argument("--imu-hz", type=int, default=400)
+    ap.add_argument("--gps-hz", type=int, default=10)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args(argv)
+    run_mock(args.secs, args.imu_hz, args.gps_hz, args.seed)
+    return 0
+
+
 if __name__ == "__main__":
-    run_mock()
+    raise SystemExit(main())
@@ -7,18 +7,21 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
+REQUIRED = ("t", "px", "py", "vx", "vy", "tx", "ty", "wp_index")
+
 
 def compute_kpis_df(df: pd.DataFrame) -> dict:
-    required = ["t", "px", "py", "vx", "vy", "tx", "ty", "wp_index"]
-    missing = [c for c in required if c not in df.columns]
+    missing = [c for c in REQUIRED if c not in df.columns]
     if missing:
         raise ValueError(f"missing columns: {missing}")
+    # plain float64 arrays: the reductions below skip Series index alignment
+    col = {c: df[c].to_numpy(dtype=np.float64) for c in REQUIRED if c != "wp_index"}
 
     # Tracking error vs current target
-    err = np.hypot(df["tx"] - df["px"], df["ty"] - df["py"])
+    err = np.hypot(col["tx"] - col["px"], col["ty"] - col["py"])
 
     # Sampling stats
-    t = df["t"].to_numpy()
+    t = col["t"]
     dt = float(np.median(np.diff(t))) if len(t) > 1 else 1.0
     sample_hz = 1.0 / dt if dt > 0 else float("nan")
 
@@ -30,7 +33,7 @@ def compute_kpis_df(df: pd.DataFrame) -> dict:
     first_hit_s = float(t[hit_mask][0]) if hits > 0 else None
     last_hit_s = float(t[hit_mask][-1]) if hits > 0 else None
 
-    speed = np.hypot(df["vx"], df["vy"]).to_numpy()
+    speed = np.hypot(col["vx"], col["vy"])
 
     k = {
         "avg_err": float(err.mean()),
@@ -61,7 +64,9 @@ def main(argv: list[str] | None = None) -> int:
     )
     args = ap.parse_args(argv)
 
-    df = pd.read_csv(args.csv)
+    # only parse the columns the KPIs use (EKF logs carry many more); a callable
+    # usecols leaves missing ones for compute_kpis_df to report
+    df = pd.read_csv(args.csv, usecols=lambda c: c in REQUIRED)
     k = compute_kpis_df(df)
 
     Path(args.json_out).parent.mkdir(parents=True, exist_ok=True)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import argparse
 import csv
 import json
 import math
@@ -9,7 +10,7 @@ from typing import List, Tuple
 
 import numpy as np
 
-from src.controllers.fixedwing.l1 import l1_lateral_accel
+from src.controllers.fixedwing.l1 import L1Leg, l1_lateral_accel_on_leg
 from src.controllers.fixedwing.tecs import tecs_vertical_speed_cmd
 
 OUT = Path("artifacts/fixedwing")
@@ -47,27 +48,33 @@ def run_sim(dt: float = 0.05, steps: int = 2400, speed: float = 15.0):
     # start near the first leg to limit initial transient
     pos = np.array([-20.0, -20.0, 20.0], dtype=float)
     chi = 0.0  # rad
+    # heading unit vector, carried across ticks: each chi's cos/sin is evaluated once
+    c_chi, s_chi = math.cos(chi), math.sin(chi)
     V = float(speed)
 
     xs, ys, zs, e_xtrack = [], [], [], []
     last_alt_cmd = wps[0][2]
 
+    # leg geometry is invariant until the segment switches
+    legs = [L1Leg.from_waypoints(wps[i][:2], wps[(i + 1) % len(wps)][:2]) for i in range(len(wps))]
+
     for _ in range(steps):
         wp_prev = (wps[seg][0], wps[seg][1])
         wp_next = (wps[(seg + 1) % len(wps)][0], wps[(seg + 1) % len(wps)][1])
         alt_cmd = wps[(seg + 1) % len(wps)][2]
         last_alt_cmd = alt_cmd
 
-        vel = (V * math.cos(chi), V * math.sin(chi))
-        a_y = l1_lateral_accel(
-            (pos[0], pos[1]), vel, wp_prev, wp_next, L1_period=12.0, damping=0.75, a_max=15.0
+        vel = (V * c_chi, V * s_chi)
+        a_y = l1_lateral_accel_on_leg(
+            (pos[0], pos[1]), vel, legs[seg], L1_period=12.0, damping=0.75, a_max=15.0
         )
         chi += (a_y / V) * dt
+        c_chi, s_chi = math.cos(chi), math.sin(chi)
 
         vdot = tecs_vertical_speed_cmd(pos[2], alt_cmd, V, kp_alt=0.8, vdot_lim_frac=0.35)
 
-        pos[0] += V * math.cos(chi) * dt
-        pos[1] += V * math.sin(chi) * dt
+        pos[0] += V * c_chi * dt
+        pos[1] += V * s_chi * dt
         pos[2] += vdot * dt
 
         xs.append(pos[0])
@@ -96,5 +103,15 @@ def run_sim(dt: float = 0.05, steps: int = 2400, speed: float = 15.0):
     return metrics
 
 
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Fixed-wing L1 + TECS rectangle mission demo")
+    ap.add_argument("--dt", type=float, default=0.05)
+    ap.add_argument("--steps", type=int, default=2400)
+    ap.add_argument("--speed", type=float, default=15.0)
+    args = ap.parse_args(argv)
+    run_sim(args.dt, args.steps, args.speed)
+    return 0
+
+
 if __name__ == "__main__":
-    run_sim()
+    raise SystemExit(main())
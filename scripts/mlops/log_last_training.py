@@ -25,10 +25,10 @@ def read_metrics_csv(p: Path) -> list[dict]:
         return list(csv.DictReader(f))
 
 
-def main():
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--config", default=CFG)
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
     cfg = load_cfg(args.config)
 
     # basic checks
@@ -62,7 +62,8 @@ def main():
             if p.is_file():
                 mlflow.log_artifact(str(p))
         print(f"OK: logged run_id={run.info.run_id}")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -8,7 +8,7 @@ from pathlib import Path
 import matplotlib.pyplot as plt
 import numpy as np
 
-from src.estimators.ekf_cv import EKFCV, geodetic_to_local_xy
+from src.estimators.ekf_cv import EKFCV, geodetic_to_local_xy_batch
 
 """
 Input: artifacts/waypoint_run.csv (expected columns)
@@ -69,11 +69,10 @@ def main(in_path: str):
             z_meas.append(fnum(d, "rel_alt_m", 0.0))
         mode = "local_xy_columns"
     elif use_geo:
-        for d in rows:
-            x, y = geodetic_to_local_xy(lat0, lon0, fnum(d, "lat", 0.0), fnum(d, "lon", 0.0))
-            x_meas.append(x)
-            y_meas.append(y)
-            z_meas.append(fnum(d, "rel_alt_m", 0.0))
+        xs, ys = geodetic_to_local_xy_batch(lat0, lon0, lats, lons)
+        x_meas = xs.tolist()
+        y_meas = ys.tolist()
+        z_meas = [fnum(d, "rel_alt_m", 0.0) for d in rows]
         mode = "geodetic"
     else:
         # integrate velocities (east=ve, north=vn)
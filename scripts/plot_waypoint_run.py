@@ -6,6 +6,7 @@ import os
 from pathlib import Path
 from typing import Iterable
 
+import numpy as np
 import pandas as pd
 
 # matplotlib is not in CI; install locally if needed:
@@ -16,33 +17,41 @@ except Exception as e:  # pragma: no cover
     raise SystemExit("matplotlib is required for plotting. Try: pip install matplotlib") from e
 
 
-def _unique_waypoints(tx: pd.Series, ty: pd.Series) -> list[tuple[float, float]]:
+def _unique_waypoints(tx: np.ndarray, ty: np.ndarray) -> list[tuple[float, float]]:
     """Deduplicate consecutive (tx,ty) entries into a waypoint list."""
-    pts: list[tuple[float, float]] = []
-    last = (None, None)
-    for x, y in zip(tx, ty):
-        cur = (float(x), float(y))
-        if cur != last:
-            pts.append(cur)
-            last = cur
-    return pts
+    if tx.size == 0:
+        return []
+    keep = np.ones(tx.size, dtype=bool)
+    keep[1:] = (tx[1:] != tx[:-1]) | (ty[1:] != ty[:-1])
+    return list(zip(tx[keep].tolist(), ty[keep].tolist()))
+
+
+REQUIRED: tuple[str, ...] = ("t", "px", "py", "vx", "vy", "tx", "ty", "wp_index")
+OPTIONAL: tuple[str, ...] = ("px_est", "py_est")  # EKF runs only
 
 
 def load_df(path: str) -> pd.DataFrame:
     df = pd.read_csv(path)
-    required: Iterable[str] = ("t", "px", "py", "vx", "vy", "tx", "ty", "wp_index")
+    required: Iterable[str] = REQUIRED
     missing = [c for c in required if c not in df.columns]
     if missing:
         raise SystemExit(f"CSV missing required columns: {missing}")
     return df
 
 
-def plot_xy(df: pd.DataFrame) -> None:
+def columns(df: pd.DataFrame) -> dict[str, np.ndarray]:
+    """Extract the plotted columns once as float64 arrays; other columns (mode or
+    status strings, ...) are left alone."""
+    used = [c for c in REQUIRED + OPTIONAL if c in df.columns]
+    return {c: df[c].to_numpy(dtype=np.float64, na_value=np.nan) for c in used}
+
+
+def plot_xy(cols: dict[str, np.ndarray]) -> None:
     plt.figure()
-    plt.plot(df["px"], df["py"], label="truth (px,py)")
-    if {"px_est", "py_est"}.issubset(df.columns):
-        plt.plot(df["px_est"], df["py_est"], label="EKF (px,py)")
-    wps = _unique_waypoints(df["tx"], df["ty"])
+    plt.plot(cols["px"], cols["py"], label="truth (px,py)")
+    if "px_est" in cols and "py_est" in cols:
+        plt.plot(cols["px_est"], cols["py_est"], label="EKF (px,py)")
+    wps = _unique_waypoints(cols["tx"], cols["ty"])
     if wps:
         xs, ys = zip(*wps)
         plt.scatter(xs, ys, marker="x", label="waypoints")
@@ -53,18 +62,16 @@ def plot_xy(df: pd.DataFrame) -> None:
     plt.axis("equal")
 
 
-def plot_timeseries(df: pd.DataFrame) -> None:
+def plot_timeseries(cols: dict[str, np.ndarray]) -> None:
     plt.figure()
-    if {"px_est", "py_est"}.issubset(df.columns):
-        dx = df["px"] - df["px_est"]
-        dy = df["py"] - df["py_est"]
-        pos_err = (dx * dx + dy * dy) ** 0.5
-        plt.plot(df["t"], pos_err, label="|pos error|")
+    if "px_est" in cols and "py_est" in cols:
+        pos_err = np.hypot(cols["px"] - cols["px_est"], cols["py"] - cols["py_est"])
+        plt.plot(cols["t"], pos_err, label="|pos error|")
         plt.ylabel("position error [m]")
         plt.title("EKF position error vs time")
     else:
-        speed = (df["vx"] * df["vx"] + df["vy"] * df["vy"]) ** 0.5
-        plt.plot(df["t"], speed, label="speed")
+        speed = np.hypot(cols["vx"], cols["vy"])
+        plt.plot(cols["t"], speed, label="speed")
         plt.ylabel("speed [m/s]")
         plt.title("Speed vs time")
     plt.xlabel("t [s]")
@@ -91,10 +98,10 @@ def main(argv: list[str] | None = None) -> int:
     args = ap.parse_args(argv)
 
     os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
-    df = load_df(args.csv)
+    cols = columns(load_df(args.csv))
 
-    plot_xy(df)
-    plot_timeseries(df)
+    plot_xy(cols)
+    plot_timeseries(cols)
 
     # Save the last figure as a combined PNG by grabbing the active manager canvas
     # Preferably, save all figures to one image: we’ll just save the current figure
@@ -85,6 +85,20 @@ def _load_yaml(path: str) -> dict:
         return {}
 
 
+def _scan_dir(path: str) -> Dict[str, os.DirEntry]:
+    # One readdir per directory instead of a stat per probed file.
+    try:
+        with os.scandir(path) as it:
+            return {e.name: e for e in it}
+    except OSError:
+        return {}
+
+
+def _load_json_entry(entries: Dict[str, os.DirEntry], name: str) -> dict:
+    with open(entries[name].path, "rb") as f:
+        return json.load(f) or {}
+
+
 def _docker_image_size_mb(image: str) -> float | None:
     try:
         out = subprocess.check_output(
@@ -204,16 +218,16 @@ def main() -> int:
             except Exception:
                 pass
 
+    artifacts = _scan_dir("artifacts")
+    workflows = _scan_dir(".github/workflows")
+
     # #19: Data Labeling, QA & Governance
-    has_labeling_bits = all(
-        os.path.exists(p)
-        for p in (
-            "configs/labeling/labelmap.yaml",
-            "scripts/labeling/qa_check.py",
-            ".github/workflows/label_qa.yml",
-        )
+    has_labeling_bits = (
+        "labelmap.yaml" in _scan_dir("configs/labeling")
+        and "qa_check.py" in _scan_dir("scripts/labeling")
+        and "label_qa.yml" in workflows
     )
-    if has_labeling_bits and os.path.exists("artifacts/label_qa.json"):
+    if has_labeling_bits and "label_qa.json" in artifacts:
         try:
             # If file exists and parsed, call it good for now
             status[19] = GREEN
@@ -223,29 +237,26 @@ def main() -> int:
         status[19] = RED
 
     # #20: Safety gate (Transport Canada SOPs)
-    slc = "artifacts/safety_last_check.json"
-    if os.path.exists(slc):
+    if "safety_last_check.json" in artifacts:
         try:
-            ok = bool(json.load(open(slc)).get("ok"))
+            ok = bool(_load_json_entry(artifacts, "safety_last_check.json").get("ok"))
             status[20] = GREEN if ok else YELLOW
         except Exception:
             status[20] = YELLOW
 
     # #21: Secrets & Config Hygiene
     try:
-        pc = os.path.exists(".pre-commit-config.yaml") and (
-            "forbid-dotenv" in open(".pre-commit-config.yaml").read()
-        )
+        with open(".pre-commit-config.yaml") as f:
+            pc = "forbid-dotenv" in f.read()
     except Exception:
         pc = False
-    ci = os.path.exists(".github/workflows/secrets_scan.yml")
+    ci = "secrets_scan.yml" in workflows
     status[21] = GREEN if (pc and ci) else YELLOW
 
     # #24: Mission & Parameter Bundles
-    mlc = "artifacts/mission_last_check.json"
-    if os.path.exists(mlc):
+    if "mission_last_check.json" in artifacts:
         try:
-            ok = bool(json.load(open(mlc)).get("ok"))
+            ok = bool(_load_json_entry(artifacts, "mission_last_check.json").get("ok"))
             status[24] = GREEN if ok else YELLOW
         except Exception:
             status[24] = YELLOW
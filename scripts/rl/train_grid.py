@@ -86,12 +86,17 @@ def run_train(episodes=400, eps=0.2, gamma=0.98, alpha=0.6, seed=7):
     print("Summary:", json.dumps(summary))
 
 
-if __name__ == "__main__":
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--episodes", type=int, default=400)
     ap.add_argument("--eps", type=float, default=0.2)
     ap.add_argument("--gamma", type=float, default=0.98)
     ap.add_argument("--alpha", type=float, default=0.6)
     ap.add_argument("--seed", type=int, default=7)
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
     run_train(args.episodes, args.eps, args.gamma, args.alpha, args.seed)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
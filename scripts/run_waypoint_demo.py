@@ -50,7 +50,9 @@ def main(argv: list[str] | None = None) -> int:
     ap.add_argument("--planner", choices=["astar", "rrt"], default="astar")
     ap.add_argument("--rrt-seed", type=int, default=0)
     ap.add_argument("--scale", type=float, default=1.0, help="meters per grid cell")
-    ap.add_argument("--dt", type=float, default=0.02)
+    # the plant integrates drag semi-implicitly (stable at any step), and dt=0.05 tracks
+    # the waypoints about as closely as 0.02 at 2.5x fewer steps
+    ap.add_argument("--dt", type=float, default=0.05)
     ap.add_argument("--sim-seconds", type=float, default=30.0)
     ap.add_argument("--wp-radius", type=float, default=0.2)
     ap.add_argument("--pid-config", default="configs/pid_pos.yaml")
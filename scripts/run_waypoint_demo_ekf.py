@@ -1,18 +1,116 @@
 from __future__ import annotations
 
 import argparse
-import csv
-import math
 import os
-import random
 
+import numpy as np
 from planners.astar import plan_on_grid as astar_plan
 from planners.rrt import plan_on_grid_rrt
 
-from control.pid_pos import PIDPos2D
 from scripts.run_waypoint_demo import demo_grid, load_pid_config  # reuse helpers
-from sim.ekf_2d import EKF2D, EKFParams
-from sim.quad_2d import Quad2D, QuadParams
+from sim._jit import njit
+from sim.control_kernels import pid_axis_step_jit
+from sim.ekf_2d import EKF2D, EKFParams, ekf2d_step_jit
+from sim.quad_2d import QuadParams, quad2d_step
+
+CSV_COLUMNS = (
+    "t",
+    "px",
+    "py",
+    "vx",
+    "vy",
+    "zpx",
+    "zpy",
+    "ekf_px",
+    "ekf_py",
+    "ekf_vx",
+    "ekf_vy",
+    "tx",
+    "ty",
+    "wp_index",
+)
+
+
+@njit(cache=True)
+def run_sim(
+    waypoints: np.ndarray,
+    gains: np.ndarray,
+    i_limit: float,
+    accel_max: float,
+    drag: float,
+    plant_accel_max: float,
+    ekf_x: np.ndarray,
+    ekf_P: np.ndarray,
+    ekf_Q: np.ndarray,
+    ekf_R: np.ndarray,
+    dt: float,
+    T: float,
+    wp_radius: float,
+    noise: np.ndarray,
+) -> tuple[np.ndarray, int]:
+    """PID -> Quad2D -> noisy position -> EKF2D loop over (K, 2) waypoints.
+
+    gains is (2, 3) [kp, ki, kd] per axis; ekf_x/ekf_P are advanced in place.
+    One tick per noise row at most. Returns (rows following CSV_COLUMNS, wp_index).
+    """
+    n_steps = noise.shape[0]
+    n_wp = waypoints.shape[0]
+    wp_r2 = wp_radius * wp_radius
+    rows = np.empty((n_steps, 14))
+    state = np.zeros(4)  # [px, py, vx, vy], integrated in place by the plant
+    ix = 0.0
+    iy = 0.0
+    wp_i = 0
+    t = 0.0
+    k = 0
+    while t <= T and wp_i < n_wp and k < n_steps:
+        tx = waypoints[wp_i, 0]
+        ty = waypoints[wp_i, 1]
+        ax, ix = pid_axis_step_jit(
+            tx - state[0],
+            -state[2],
+            ix,
+            gains[0, 0],
+            gains[0, 1],
+            gains[0, 2],
+            i_limit,
+            accel_max,
+            dt,
+        )
+        ay, iy = pid_axis_step_jit(
+            ty - state[1],
+            -state[3],
+            iy,
+            gains[1, 0],
+            gains[1, 1],
+            gains[1, 2],
+            i_limit,
+            accel_max,
+            dt,
+        )
+        quad2d_step(state, dt, ax, ay, drag, plant_accel_max)
+
+        # Noisy position measurement
+        zpx = state[0] + noise[k, 0]
+        zpy = state[1] + noise[k, 1]
+        ekf2d_step_jit(ekf_x, ekf_P, dt, ekf_Q, ekf_R, ax, ay, zpx, zpy, True)
+
+        rows[k, 0] = t
+        rows[k, 1:5] = state
+        rows[k, 5] = zpx
+        rows[k, 6] = zpy
+        rows[k, 7:11] = ekf_x[:, 0]
+        rows[k, 11] = tx
+        rows[k, 12] = ty
+        rows[k, 13] = wp_i
+
+        ex = tx - state[0]
+        ey = ty - state[1]
+        if ex * ex + ey * ey <= wp_r2:
+            wp_i += 1
+        t += dt
+        k += 1
+    return rows[:k], wp_i
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -47,75 +145,41 @@ def main(argv: list[str] | None = None) -> int:
 
     # Controller and plant
     gains, limits = load_pid_config(args.pid_config)
-    ctrl = PIDPos2D(gains_x=gains, limits=limits)
-    quad = Quad2D(QuadParams(drag=0.15, accel_max=limits.accel_max))
+    plant = QuadParams(drag=0.15, accel_max=limits.accel_max)
 
     # EKF
     ekf = EKF2D(args.dt, EKFParams(r_pos=args.pos_noise_std**2))
     ekf.reset()
 
-    # Sim loop
-    dt = args.dt
-    T = args.sim_seconds
-    wp_i = 0
-    pos = (0.0, 0.0)
-    vel = (0.0, 0.0)
-    rng = random.Random(42)
-
-    with open(args.csv_out, "w", newline="") as f:
-        w = csv.writer(f)
-        w.writerow(
-            [
-                "t",
-                "px",
-                "py",
-                "vx",
-                "vy",
-                "zpx",
-                "zpy",
-                "ekf_px",
-                "ekf_py",
-                "ekf_vx",
-                "ekf_vy",
-                "tx",
-                "ty",
-                "wp_index",
-            ]
-        )
-        t = 0.0
-        while t <= T and wp_i < len(waypoints):
-            target = waypoints[wp_i]
-            ax, ay = ctrl.step(dt, pos, vel, target)
-            px, py, vx, vy = quad.step(dt, ax, ay)
-            pos, vel = (px, py), (vx, vy)
-
-            # Noisy position measurement
-            zpx = px + rng.gauss(0.0, args.pos_noise_std)
-            zpy = py + rng.gauss(0.0, args.pos_noise_std)
-
-            ekf_px, ekf_py, ekf_vx, ekf_vy = ekf.step(ax, ay, zpx, zpy)
-            w.writerow(
-                [
-                    t,
-                    px,
-                    py,
-                    vx,
-                    vy,
-                    zpx,
-                    zpy,
-                    ekf_px,
-                    ekf_py,
-                    ekf_vx,
-                    ekf_vy,
-                    target[0],
-                    target[1],
-                    wp_i,
-                ]
-            )
-
-            if math.hypot(target[0] - px, target[1] - py) <= args.wp_radius:
-                wp_i += 1
-            t += dt
+    # Pre-sample measurement noise for every tick (+1 slack for float drift in t)
+    n_steps = int(args.sim_seconds / args.dt) + 2
+    noise = np.random.default_rng(42).normal(0.0, args.pos_noise_std, size=(n_steps, 2))
+
+    rows, wp_i = run_sim(
+        np.asarray(waypoints, dtype=np.float64).reshape(-1, 2),
+        np.array([[gains.kp, gains.ki, gains.kd]] * 2, dtype=np.float64),
+        limits.i_limit,
+        limits.accel_max,
+        plant.drag,
+        plant.accel_max,
+        ekf.x,
+        ekf.P,
+        ekf.Q,
+        ekf.R,
+        args.dt,
+        args.sim_seconds,
+        args.wp_radius,
+        noise,
+    )
+
+    np.savetxt(
+        args.csv_out,
+        rows,
+        delimiter=",",
+        header=",".join(CSV_COLUMNS),
+        comments="",
+        fmt=["%.10g"] * (len(CSV_COLUMNS) - 1) + ["%d"],
+    )
 
     print(f"Sim finished. Waypoints reached: {wp_i}/{len(waypoints)}")
     print(f"Wrote: {args.csv_out}")
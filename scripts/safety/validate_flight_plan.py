@@ -15,12 +15,20 @@ def load_yaml(path: str) -> dict:
         return yaml.safe_load(f) or {}
 
 
-def point_in_bbox(lat: float, lon: float, poly: List[Dict[str, float]]) -> bool:
+def _poly_bbox(poly: List[Dict[str, float]]) -> Tuple[float, float, float, float] | None:
+    """(lat_min, lat_max, lon_min, lon_max) of the polygon, or None if unset."""
     if not poly:
-        return True  # no geofence configured -> skip
+        return None
     lats = [p["lat"] for p in poly]
     lons = [p["lon"] for p in poly]
-    return (min(lats) <= lat <= max(lats)) and (min(lons) <= lon <= max(lons))
+    return min(lats), max(lats), min(lons), max(lons)
+
+
+def point_in_bbox(lat: float, lon: float, bbox: Tuple[float, float, float, float] | None) -> bool:
+    if bbox is None:
+        return True  # no geofence configured -> skip
+    lat_min, lat_max, lon_min, lon_max = bbox
+    return (lat_min <= lat <= lat_max) and (lon_min <= lon <= lon_max)
 
 
 def check(plan: dict, limits: dict) -> Tuple[bool, List[str], List[str]]:
@@ -29,6 +37,7 @@ def check(plan: dict, limits: dict) -> Tuple[bool, List[str], List[str]]:
     wind_max = float(limits.get("wind_max_mps", 10))
     allow_night = bool(limits.get("allow_night", False))
     geofence_poly = (limits.get("geofence") or {}).get("polygon") or []
+    geofence_bbox = _poly_bbox(geofence_poly)
 
     name = plan.get("name")
     loc = plan.get("location") or {}
@@ -49,7 +58,7 @@ def check(plan: dict, limits: dict) -> Tuple[bool, List[str], List[str]]:
         issues.append(f"Wind {wind} m/s exceeds limit {wind_max} m/s")
     if night and not allow_night:
         issues.append("Night flag true but allow_night=false in limits")
-    if not point_in_bbox(lat, lon, geofence_poly):
+    if not point_in_bbox(lat, lon, geofence_bbox):
         issues.append("Location outside geofence polygon (bbox check)")
 
     if wind is None:
@@ -2,13 +2,17 @@
 from __future__ import annotations
 
 import argparse
-import csv
 import json
 from dataclasses import dataclass
 from pathlib import Path
 
 import numpy as np
 
+try:
+    from scipy.signal import lfilter  # type: ignore
+except Exception:
+    lfilter = None
+
 OUT = Path("artifacts/sysid")
 OUT.mkdir(parents=True, exist_ok=True)
 
@@ -20,6 +24,17 @@ class true_params:
     ky: float = 0.55
 
 
+def _drag_velocity(u: np.ndarray, dt: float, m: float, k: float) -> np.ndarray:
+    """Explicit-Euler velocity from rest: v[t] = (1 - dt*k/m) v[t-1] + (dt/m) u[t-1]."""
+    decay = 1.0 - dt * k / m
+    if lfilter is not None:
+        return lfilter([0.0, dt / m], [1.0, -decay], u)
+    v = np.zeros(len(u))
+    for t in range(1, len(u)):
+        v[t] = decay * v[t - 1] + (dt / m) * u[t - 1]
+    return v
+
+
 def gen_synth(T: float = 12.0, dt: float = 0.02, seed: int = 7, m=1.5, kx=0.4, ky=0.55):
     """Generate 2D point-mass with linear drag: v' = u/m - (k/m) v."""
     rng = np.random.default_rng(seed)
@@ -28,15 +43,12 @@ def gen_synth(T: float = 12.0, dt: float = 0.02, seed: int = 7, m=1.5, kx=0.4, k
     seg = max(1, int(0.6 / dt))
     ux = np.repeat(rng.uniform(-3, 3, size=n // seg + 1), seg)[:n]
     uy = np.repeat(rng.uniform(-3, 3, size=n // seg + 1), seg)[:n]
-    vx = np.zeros(n)
-    vy = np.zeros(n)
+    vx = _drag_velocity(ux, dt, m, kx)
+    vy = _drag_velocity(uy, dt, m, ky)
     ax = np.zeros(n)
     ay = np.zeros(n)
-    for t in range(1, n):
-        ax[t] = (ux[t - 1] / m) - (kx / m) * vx[t - 1]
-        ay[t] = (uy[t - 1] / m) - (ky / m) * vy[t - 1]
-        vx[t] = vx[t - 1] + dt * ax[t]
-        vy[t] = vy[t - 1] + dt * ay[t]
+    ax[1:] = (ux[:-1] / m) - (kx / m) * vx[:-1]
+    ay[1:] = (uy[:-1] / m) - (ky / m) * vy[:-1]
     # add a touch of accel noise
     ax_n = ax + rng.normal(0, 0.05, size=n)
     ay_n = ay + rng.normal(0, 0.05, size=n)
@@ -56,7 +68,11 @@ def fit_axis(u: np.ndarray, v: np.ndarray, a: np.ndarray):
     u1 = u[:-1]
     v1 = v[:-1]
     Phi = np.stack([u1, v1], axis=1)  # [n-1, 2]
-    theta, *_ = np.linalg.lstsq(Phi, a1, rcond=None)
+    # Two regressors: solve the 2x2 normal equations instead of an SVD lstsq.
+    try:
+        theta = np.linalg.solve(Phi.T @ Phi, Phi.T @ a1)
+    except np.linalg.LinAlgError:  # unexcited axis (e.g. u == 0)
+        return np.inf, np.nan, float("inf")
     b0, b1 = theta
     if abs(b0) < 1e-9:
         return np.inf, np.nan, float("inf")
@@ -66,7 +82,7 @@ def fit_axis(u: np.ndarray, v: np.ndarray, a: np.ndarray):
     return (float(m_est), float(k_est), mse)
 
 
-def main():
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--T", type=float, default=12.0)
     ap.add_argument("--dt", type=float, default=0.02)
@@ -74,7 +90,7 @@ def main():
     ap.add_argument("--m_true", type=float, default=true_params.m)
     ap.add_argument("--kx_true", type=float, default=true_params.kx)
     ap.add_argument("--ky_true", type=float, default=true_params.ky)
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     t, ux, uy, vx, vy, ax, ay = gen_synth(
         args.T, args.dt, args.seed, args.m_true, args.kx_true, args.ky_true
@@ -85,11 +101,14 @@ def main():
     m_est = float(np.mean([m_x, m_y]))
 
     diag_csv = OUT / "est_diagnostics.csv"
-    with diag_csv.open("w", newline="") as f:
-        w = csv.writer(f)
-        w.writerow(["t", "ux", "uy", "vx", "vy", "ax", "ay"])
-        for i in range(len(t)):
-            w.writerow([t[i], ux[i], uy[i], vx[i], vy[i], ax[i], ay[i]])
+    np.savetxt(
+        diag_csv,
+        np.column_stack([t, ux, uy, vx, vy, ax, ay]),
+        delimiter=",",
+        header="t,ux,uy,vx,vy,ax,ay",
+        comments="",
+        fmt="%.10g",
+    )
 
     params = {
         "m_est": m_est,
@@ -105,7 +124,8 @@ def main():
     (OUT / "est_params.json").write_text(json.dumps(params, indent=2))
     print("Wrote:", diag_csv, "and", OUT / "est_params.json")
     print(json.dumps(params))
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -15,16 +15,18 @@ import json
 import math
 from pathlib import Path
 
+M_PER_DEG_LAT = 111320.0
 
-def meters_to_deg(lat_deg: float, east_m: float, north_m: float):
+
+def meters_to_deg(lat_deg: float, east_m, north_m):
     """
     Convert local ENU meters (east, north) near lat_deg to degrees (dlat, dlon).
     Rough Earth radius approximation is sufficient for small rectangles.
+    east_m / north_m may be floats or NumPy arrays of offsets sharing lat_deg
+    (e.g. every leg of a survey in one call); not valid at the poles.
     """
-    lat_rad = math.radians(lat_deg)
-    dlat = north_m / 111320.0
-    dlon = east_m / (111320.0 * math.cos(lat_rad) + 1e-12)
-    return dlat, dlon
+    m_per_deg_lon = M_PER_DEG_LAT * math.cos(math.radians(lat_deg))
+    return north_m / M_PER_DEG_LAT, east_m / m_per_deg_lon
 
 
 def make_rect(lat0: float, lon0: float, leg_x_m: float, leg_y_m: float):
@@ -78,7 +80,7 @@ def build_qgc_plan(points, alt_m: float, lat0: float, lon0: float):
     }
 
 
-def main():
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--lat", type=float, default=47.397971, help="center lat (deg)")
     ap.add_argument("--lon", type=float, default=8.546164, help="center lon (deg)")
@@ -95,21 +97,24 @@ def main():
         action="store_true",
         help="also write sha256 file next to the plan",
     )
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     pts = make_rect(args.lat, args.lon, args.leg_x, args.leg_y)
     plan = build_qgc_plan(pts, args.alt, args.lat, args.lon)
 
     out = Path(args.out)
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(json.dumps(plan, indent=2) + "\n")
+    blob = (json.dumps(plan, indent=2) + "\n").encode("utf-8")
+    out.write_bytes(blob)
     print(f"✅ wrote {out} with {len(plan['mission']['items'])} items")
 
     if args.write_sha:
-        sha = hashlib.sha256(out.read_bytes()).hexdigest()
+        # hash the bytes we just wrote rather than reading the file back
+        sha = hashlib.sha256(blob).hexdigest()
         (out.with_suffix(out.suffix + ".sha256")).write_text(f"{sha}  {out.name}\n")
         print(f"🔐 sha256: {sha}")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -1,21 +1,28 @@
 import argparse
 import os
 
-import gymnasium as gym
-from stable_baselines3 import PPO
-from stable_baselines3.common.vec_env import DummyVecEnv
-
-# Import registers the env id "Px4GzHoverEnv-v0"
-import rl.envs  # noqa: F401
+# gymnasium / stable_baselines3 (and torch behind them) are imported lazily so
+# `--help` and test collection do not pay their import cost.
 
 
 def make_env(env_id: str, **env_kwargs):
     def _thunk():
+        import gymnasium as gym
+
+        # Import registers the env id "Px4GzHoverEnv-v0"
+        import rl.envs  # noqa: F401
+
         return gym.make(env_id, **env_kwargs)
 
     return _thunk
 
 
+def udp_url_for(base_url: str, i: int) -> str:
+    """Offset the port of `base_url` (e.g. udp://:14540) by i, one PX4 instance per env."""
+    head, _, port = base_url.rpartition(":")
+    return f"{head}:{int(port) + i}"
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -23,11 +30,20 @@ def main():
     )
     parser.add_argument("--total-steps", type=int, default=10_000)
     parser.add_argument("--udp-url", type=str, default="udp://:14540")
+    parser.add_argument(
+        "--n-envs",
+        type=int,
+        default=1,
+        help="parallel envs in subprocesses; env i talks to --udp-url port + i, "
+        "so start one PX4 SITL instance per env",
+    )
     args = parser.parse_args()
 
+    from stable_baselines3 import PPO
+    from stable_baselines3.common.vec_env import DummyVecEnv, SubprocVecEnv
+
     # Env kwargs (align with our env defaults)
     env_kwargs = dict(
-        udp_url=args.udp_url,
         step_hz=10.0,
         nudge=0.3,
         episode_seconds=20,
@@ -37,7 +53,12 @@ def main():
     )
 
     env_id = "Px4GzHoverEnv-v0"
-    vec_env = DummyVecEnv([make_env(env_id, **env_kwargs)])
+    env_fns = [
+        make_env(env_id, udp_url=udp_url_for(args.udp_url, i), **env_kwargs)
+        for i in range(args.n_envs)
+    ]
+    # Rollouts are bound by env-step latency (UDP to PX4), so step envs concurrently.
+    vec_env = SubprocVecEnv(env_fns) if args.n_envs > 1 else DummyVecEnv(env_fns)
 
     model = PPO("MlpPolicy", vec_env, verbose=1)
     model.learn(total_timesteps=args.total_steps)
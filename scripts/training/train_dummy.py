@@ -2,12 +2,12 @@
 from __future__ import annotations
 
 import argparse
-import csv
 import json
 from pathlib import Path
 
 import numpy as np
-import yaml
+
+from sim._jit import HAVE_NUMBA, njit, prange
 
 
 # MLflow is optional: if not installed, we just skip logging to it.
@@ -42,8 +42,55 @@ def sigmoid(z: np.ndarray) -> np.ndarray:
     return 1.0 / (1.0 + np.exp(-z))
 
 
-def make_data(n: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
-    rng = np.random.default_rng(seed)
+def _step_logreg_np(Xb: np.ndarray, y: np.ndarray, w: np.ndarray, lr: float) -> tuple[float, float]:
+    """One full-batch gradient step on mean BCE; updates w in place, returns (loss, acc)."""
+    n = Xb.shape[0]
+    p = sigmoid(Xb @ w)
+    eps = 1e-9
+    loss = -np.mean(y * np.log(p + eps) + (1 - y) * np.log(1 - p + eps))
+    acc = np.mean((p >= 0.5).astype(int) == y)
+    w -= lr * (Xb.T @ (p - y)) / n
+    return float(loss), float(acc)
+
+
+_LOGREG_CHUNKS = 64
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _step_logreg_jit(Xb, y, w, lr):
+    """_step_logreg_np as one fused pass over rows: logits, sigmoid, BCE, accuracy and
+    gradient. Rows are split into fixed chunks, each accumulating into its own row of
+    partial sums, so threads never share an accumulator and the result does not
+    depend on the thread count."""
+    n, d = Xb.shape
+    eps = 1e-9
+    nc = min(n, _LOGREG_CHUNKS)
+    loss_c = np.zeros(nc)
+    hits_c = np.zeros(nc)
+    grad_c = np.zeros((nc, d))
+    for c in prange(nc):
+        for i in range(c * n // nc, (c + 1) * n // nc):
+            z = 0.0
+            for j in range(d):
+                z += Xb[i, j] * w[j]
+            p = 1.0 / (1.0 + np.exp(-z))
+            loss_c[c] -= y[i] * np.log(p + eps) + (1 - y[i]) * np.log(1 - p + eps)
+            hits_c[c] += 1.0 if (p >= 0.5) == (y[i] == 1) else 0.0
+            r = p - y[i]
+            for j in range(d):
+                grad_c[c, j] += r * Xb[i, j]
+    for j in range(d):
+        g = 0.0
+        for c in range(nc):
+            g += grad_c[c, j]
+        w[j] -= lr * g / n
+    return loss_c.sum() / n, hits_c.sum() / n
+
+
+step_logreg = _step_logreg_jit if HAVE_NUMBA else _step_logreg_np
+
+
+def make_data(n: int, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
     # linearly separable with mild noise
     w_true = np.array([1.5, -0.8], dtype=float)
     b_true = 0.3
@@ -53,61 +100,61 @@ def make_data(n: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
     return X, y
 
 
-def train_logreg(X: np.ndarray, y: np.ndarray, epochs: int, lr: float, seed: int):
-    rng = np.random.default_rng(seed)
+def train_logreg(X: np.ndarray, y: np.ndarray, epochs: int, lr: float, rng: np.random.Generator):
     n, d = X.shape
     # add bias column
     Xb = np.hstack([X, np.ones((n, 1))])
     w = rng.normal(0, 0.1, size=(d + 1,))
-    history = []
-    for ep in range(1, epochs + 1):
-        z = Xb @ w
-        p = sigmoid(z)
-        # loss: mean BCE
-        eps = 1e-9
-        loss = -np.mean(y * np.log(p + eps) + (1 - y) * np.log(1 - p + eps))
-        pred = (p >= 0.5).astype(int)
-        acc = float(np.mean(pred == y))
-        # gradient
-        grad = (Xb.T @ (p - y)) / n
-        w -= lr * grad
-        history.append({"epoch": ep, "loss": float(loss), "acc": acc})
+    # columns: epoch, loss, acc
+    history = np.empty((epochs, 3))
+    history[:, 0] = np.arange(1, epochs + 1)
+    for ep in range(epochs):
+        loss, acc = step_logreg(Xb, y, w, lr)
+        history[ep, 1] = loss
+        history[ep, 2] = acc
     return w, history
 
 
-def main():
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--config", default="configs/training/dummy.yaml")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
+
+    import yaml
 
     cfg = yaml.safe_load(open(args.config))
     out_dir = Path(cfg.get("output_dir", "artifacts/training"))
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    X, y = make_data(int(cfg.get("n_samples", 400)), int(cfg.get("seed", 7)))
-    w, hist = train_logreg(
-        X, y, int(cfg.get("epochs", 25)), float(cfg.get("lr", 0.2)), int(cfg.get("seed", 7))
-    )
+    # one generator: weight init continues the data stream instead of replaying the seed
+    rng = np.random.default_rng(int(cfg.get("seed", 7)))
+    X, y = make_data(int(cfg.get("n_samples", 400)), rng)
+    w, hist = train_logreg(X, y, int(cfg.get("epochs", 25)), float(cfg.get("lr", 0.2)), rng)
 
     # save artifacts
     metrics_csv = out_dir / "metrics.csv"
-    with metrics_csv.open("w", newline="") as f:
-        wri = csv.DictWriter(f, fieldnames=["epoch", "loss", "acc"])
-        wri.writeheader()
-        wri.writerows(hist)
+    np.savetxt(
+        metrics_csv,
+        hist,
+        delimiter=",",
+        header="epoch,loss,acc",
+        comments="",
+        fmt=("%d", "%.10g", "%.10g"),
+    )
 
     model_npz = out_dir / "model_dummy.npz"
     np.savez(model_npz, w=w)
 
     summary_json = out_dir / "summary.json"
-    final = {"final_loss": hist[-1]["loss"], "final_acc": hist[-1]["acc"]}
+    final = {"final_loss": float(hist[-1, 1]), "final_acc": float(hist[-1, 2])}
     summary_json.write_text(json.dumps(final, indent=2))
 
     print(f"Wrote: {metrics_csv}, {model_npz}, {summary_json}")
 
     # optional MLflow logging
     try_mlflow_log(cfg, [metrics_csv, model_npz, summary_json], final)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+# numba is optional: without it ``njit`` is a no-op decorator, ``prange`` is
+# ``range``, and callers should prefer their NumPy code paths (check HAVE_NUMBA)
+# over the scalar kernels.
+try:
+    from numba import njit, prange  # type: ignore
+
+    HAVE_NUMBA = True
+except Exception:  # pragma: no cover - exercised only when numba is missing
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda f: f
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from control.pid_pos import pid_axis_step
+from sim._jit import njit
+from src.controllers.lqr.lqr_position import lqr_axis_step
+
+# Jitted twins of the controller laws, for control loops that run inside numba
+# (run_sim in the EKF demo, the step-move rollouts below). The controller classes
+# call the plain-Python functions: from the interpreter, a jitted call's dispatch
+# costs more than these few flops.
+pid_axis_step_jit = njit(cache=True)(pid_axis_step)
+lqr_axis_step_jit = njit(cache=True)(lqr_axis_step)
+
+
+@njit(cache=True)
+def simulate_pid_step_move(
+    kp: float,
+    ki: float,
+    kd: float,
+    i_limit: float,
+    accel_max: float,
+    dt: float,
+    n: int,
+    tx: float,
+    ty: float,
+) -> tuple[float, float, float, float]:
+    """n ticks of PIDPos2D.step (same gains on both axes, zero target velocity) on a
+    double integrator starting at rest at the origin -> final (px, py, vx, vy)."""
+    px = py = vx = vy = 0.0
+    ix = iy = 0.0
+    for _ in range(n):
+        ax, ix = pid_axis_step_jit(tx - px, -vx, ix, kp, ki, kd, i_limit, accel_max, dt)
+        ay, iy = pid_axis_step_jit(ty - py, -vy, iy, kp, ki, kd, i_limit, accel_max, dt)
+        vx += ax * dt
+        vy += ay * dt
+        px += vx * dt
+        py += vy * dt
+    return px, py, vx, vy
+
+
+@njit(cache=True)
+def simulate_lqr_step_move(
+    kx: float,
+    kv: float,
+    ki: float,
+    i_limit: float,
+    accel_max: float,
+    dt: float,
+    n: int,
+    tx: float,
+    ty: float,
+) -> tuple[float, float, float, float]:
+    """simulate_pid_step_move for LQRPos2D.step (same gains on both axes)."""
+    px = py = vx = vy = 0.0
+    ix = iy = 0.0
+    for _ in range(n):
+        ax, ix = lqr_axis_step_jit(tx - px, vx, ix, kx, kv, ki, i_limit, accel_max, dt)
+        ay, iy = lqr_axis_step_jit(ty - py, vy, iy, kx, kv, ki, i_limit, accel_max, dt)
+        vx += ax * dt
+        vy += ay * dt
+        px += vx * dt
+        py += vy * dt
+    return px, py, vx, vy
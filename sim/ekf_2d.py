@@ -4,6 +4,8 @@ from dataclasses import dataclass
 
 import numpy as np
 
+from sim._jit import HAVE_NUMBA, njit
+
 
 @dataclass
 class EKFParams:
@@ -13,6 +15,82 @@ class EKFParams:
     r_pos: float = 0.3**2  # (meters)^2
 
 
+@njit(cache=True, fastmath=True)
+def ekf2d_step_jit(
+    x: np.ndarray,
+    P: np.ndarray,
+    dt: float,
+    Q: np.ndarray,
+    R: np.ndarray,
+    ax: float,
+    ay: float,
+    zpx: float,
+    zpy: float,
+    has_meas: bool,
+) -> None:
+    """In-place predict (+ optional position update) on x (4,1) and P (4,4).
+
+    Scalar form of EKF2D.predict/update: F = [[I, dt*I], [0, I]] and H = [I, 0]
+    are applied by index instead of as dense matmuls, and S^-1 is the closed-form
+    2x2 inverse.
+    """
+    h = 0.5 * dt * dt
+    x[0, 0] += dt * x[2, 0] + h * ax
+    x[1, 0] += dt * x[3, 0] + h * ay
+    x[2, 0] += dt * ax
+    x[3, 0] += dt * ay
+
+    # P <- F P F^T + Q
+    for j in range(4):
+        P[0, j] += dt * P[2, j]
+        P[1, j] += dt * P[3, j]
+    for i in range(4):
+        P[i, 0] += dt * P[i, 2]
+        P[i, 1] += dt * P[i, 3]
+    for i in range(4):
+        for j in range(4):
+            P[i, j] += Q[i, j]
+
+    if not has_meas:
+        return
+
+    # S = H P H^T + R, K = P H^T S^-1
+    s00 = P[0, 0] + R[0, 0]
+    s01 = P[0, 1] + R[0, 1]
+    s10 = P[1, 0] + R[1, 0]
+    s11 = P[1, 1] + R[1, 1]
+    inv_det = 1.0 / (s00 * s11 - s01 * s10)
+    i00 = s11 * inv_det
+    i01 = -s01 * inv_det
+    i10 = -s10 * inv_det
+    i11 = s00 * inv_det
+
+    y0 = zpx - x[0, 0]
+    y1 = zpy - x[1, 0]
+    K = np.empty((4, 2))
+    for i in range(4):
+        K[i, 0] = P[i, 0] * i00 + P[i, 1] * i10
+        K[i, 1] = P[i, 0] * i01 + P[i, 1] * i11
+        x[i, 0] += K[i, 0] * y0 + K[i, 1] * y1
+
+    # P <- (I - K H) P = P - K P[0:2, :]
+    r0 = P[0].copy()
+    r1 = P[1].copy()
+    for i in range(4):
+        for j in range(4):
+            P[i, j] -= K[i, 0] * r0[j] + K[i, 1] * r1[j]
+
+
+def _f64_buffer(attr: str, shape: tuple[int, int]) -> property:
+    def get(self: EKF2D) -> np.ndarray:
+        return getattr(self, attr)
+
+    def set(self: EKF2D, v: np.ndarray) -> None:
+        setattr(self, attr, np.ascontiguousarray(v, dtype=np.float64).reshape(shape))
+
+    return property(get, set)
+
+
 class EKF2D:
     """Constant-acceleration EKF on (px, py, vx, vy) with accel input u=(ax, ay).
     Measurements are noisy positions z=(px, py)."""
@@ -21,7 +99,7 @@ class EKF2D:
         self.dt = float(dt)
         self.p = params or EKFParams()
         self.x = np.zeros((4, 1))  # [px, py, vx, vy]^T
-        self.P = np.eye(4) * 1.0
+        self.P = np.eye(4)
 
         dt = self.dt
         self.F = np.array([[1, 0, dt, 0], [0, 1, 0, dt], [0, 0, 1, 0], [0, 0, 0, 1]], dtype=float)
@@ -31,30 +109,77 @@ class EKF2D:
         self.Q = np.diag([self.p.q_pos, self.p.q_pos, self.p.q_vel, self.p.q_vel])
         self.R = np.eye(2) * self.p.r_pos
 
+        # Scratch buffers reused by predict/update so a step does not allocate them.
+        self._I4 = np.eye(4)
+        self._u = np.zeros(2)
+        self._y = np.zeros((2, 1))
+        self._S = np.zeros((2, 2))
+        self._inv_S = np.zeros((2, 2))
+        self._K = np.zeros((4, 2))
+        self._KHP = np.zeros((4, 4))
+
+    # Handed to ekf2d_step_jit and updated in place, so kept C-contiguous float64
+    # even when reassigned (an int or strided array would otherwise trigger a fresh
+    # specialization or integer arithmetic).
+    x = _f64_buffer("_x", (4, 1))
+    P = _f64_buffer("_P", (4, 4))
+    Q = _f64_buffer("_Q", (4, 4))
+    R = _f64_buffer("_R", (2, 2))
+
     def reset(self, px: float = 0.0, py: float = 0.0, vx: float = 0.0, vy: float = 0.0) -> None:
-        self.x[:] = np.array([[px], [py], [vx], [vy]], dtype=float)
-        self.P[:] = np.eye(4) * 1.0
+        self.x[:, 0] = (px, py, vx, vy)
+        self.P[:] = self._I4
 
     def predict(self, ax: float, ay: float) -> None:
-        u = np.array([[ax], [ay]], dtype=float)
-        self.x = self.F @ self.x + self.B @ u
-        self.P = self.F @ self.P @ self.F.T + self.Q
+        # F = [[I, dt*I], [0, I]], so F x + B u and F P F^T reduce to block updates:
+        # P <- [[A + dt(B + C) + dt^2 D, B + dt D], [C + dt D, D]] + Q
+        dt = self.dt
+        u = self._u
+        u[0], u[1] = ax, ay
+        x, P = self.x, self.P
+        x[0:2, 0] += dt * x[2:4, 0] + 0.5 * dt * dt * u
+        x[2:4, 0] += dt * u
+        P[0:2, :] += dt * P[2:4, :]
+        P[:, 0:2] += dt * P[:, 2:4]
+        P += self.Q
 
     def update(self, zpx: float, zpy: float) -> None:
-        z = np.array([[zpx], [zpy]], dtype=float)
-        y = z - (self.H @ self.x)
-        S = self.H @ self.P @ self.H.T + self.R
-        K = self.P @ self.H.T @ np.linalg.inv(S)
-        self.x = self.x + K @ y
-        I_k = np.eye(4)
-        self.P = (I_k - K @ self.H) @ self.P
+        # H = [I, 0]: H x, H P and P H^T are the position rows/columns, so the
+        # gain is one 4x2 @ 2x2 product against the closed-form inverse of S.
+        x, P = self.x, self.P
+        y = self._y
+        y[0, 0] = zpx - x[0, 0]
+        y[1, 0] = zpy - x[1, 0]
+        S = np.add(P[0:2, 0:2], self.R, out=self._S)
+        inv_S = self._inv_S
+        inv_S[0, 0], inv_S[0, 1] = S[1, 1], -S[0, 1]
+        inv_S[1, 0], inv_S[1, 1] = -S[1, 0], S[0, 0]
+        inv_S /= S[0, 0] * S[1, 1] - S[0, 1] * S[1, 0]
+        K = np.matmul(P[:, 0:2], inv_S, out=self._K)
+        x += K @ y
+        P -= np.matmul(K, P[0:2, :], out=self._KHP)
 
     def step(
         self, ax: float, ay: float, zpx: float | None, zpy: float | None
     ) -> tuple[float, float, float, float]:
-        self.predict(ax, ay)
-        if zpx is not None and zpy is not None:
-            self.update(zpx, zpy)
+        has_meas = zpx is not None and zpy is not None
+        if HAVE_NUMBA:
+            ekf2d_step_jit(
+                self.x,
+                self.P,
+                self.dt,
+                self.Q,
+                self.R,
+                float(ax),
+                float(ay),
+                float(zpx) if has_meas else 0.0,
+                float(zpy) if has_meas else 0.0,
+                has_meas,
+            )
+        else:
+            self.predict(ax, ay)
+            if has_meas:
+                self.update(zpx, zpy)
         px, py, vx, vy = (
             float(self.x[0, 0]),
             float(self.x[1, 0]),
@@ -2,9 +2,86 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
 
-def _clamp(v: float, lo: float, hi: float) -> float:
-    return hi if v > hi else lo if v < lo else v
+from sim._jit import HAVE_NUMBA, njit, prange
+
+
+@njit(cache=True)
+def quad2d_step(
+    state: np.ndarray, dt: float, ax_cmd: float, ay_cmd: float, drag: float, accel_max: float
+) -> None:
+    """Saturate and semi-implicit-Euler-integrate a [px, py, vx, vy] buffer in place.
+
+    Drag is taken at the new velocity, v' = (v + a dt) / (1 + drag dt), which decays
+    monotonically for any dt (explicit Euler flips sign once drag*dt > 1); position
+    then advances with the updated velocity. The decay factor is computed once and
+    shared by both axes.
+    """
+    inv = 1.0 / (1.0 + drag * dt)
+    ax_cmd = min(max(ax_cmd, -accel_max), accel_max)
+    ay_cmd = min(max(ay_cmd, -accel_max), accel_max)
+    state[2] = (state[2] + ax_cmd * dt) * inv
+    state[3] = (state[3] + ay_cmd * dt) * inv
+    state[0] += state[2] * dt
+    state[1] += state[3] * dt
+
+
+@njit(cache=True)
+def quad2d_rollout(
+    state: np.ndarray,
+    dt: float,
+    ax_cmd: np.ndarray,
+    ay_cmd: np.ndarray,
+    drag: float,
+    accel_max: float,
+) -> np.ndarray:
+    """quad2d_step for each (ax_cmd[k], ay_cmd[k]), advancing state in place.
+
+    Returns the (N, 4) [px, py, vx, vy] rows after each step.
+    """
+    n = ax_cmd.shape[0]
+    out = np.empty((n, 4))
+    for k in range(n):
+        quad2d_step(state, dt, ax_cmd[k], ay_cmd[k], drag, accel_max)
+        out[k, :] = state
+    return out
+
+
+@njit(parallel=True, cache=True)
+def quad2d_batch_step(
+    state: np.ndarray,
+    dt: float,
+    ax_cmd: np.ndarray,
+    ay_cmd: np.ndarray,
+    drag: float,
+    accel_max: float,
+) -> None:
+    """quad2d_step on every column of a (4, M) buffer, quads spread across cores."""
+    for i in prange(state.shape[1]):
+        quad2d_step(state[:, i], dt, ax_cmd[i], ay_cmd[i], drag, accel_max)
+
+
+# Below this many quads thread start-up outweighs the work, and the NumPy row ops win.
+PARALLEL_MIN_QUADS = 8
+
+
+def _rollout_no_drag(
+    state: np.ndarray, dt: float, ax_cmd: np.ndarray, ay_cmd: np.ndarray, accel_max: float
+) -> np.ndarray:
+    """NumPy twin of quad2d_rollout for drag == 0.
+
+    Without drag both Euler updates are running sums (v += a dt, then p += v dt), and
+    np.add.accumulate adds left to right, so the rows match the kernel bit for bit.
+    """
+    out = np.empty((ax_cmd.shape[0], 4))
+    for p_i, v_i, a in ((0, 2, ax_cmd), (1, 3, ay_cmd)):
+        dv = np.clip(a, -accel_max, accel_max) * dt
+        out[:, v_i] = np.add.accumulate(np.concatenate(([state[v_i]], dv)))[1:]
+        out[:, p_i] = np.add.accumulate(np.concatenate(([state[p_i]], out[:, v_i] * dt)))[1:]
+    if out.shape[0]:
+        state[:] = out[-1]
+    return out
 
 
 @dataclass
@@ -14,28 +91,119 @@ class QuadParams:
     accel_max: float = 3.0  # per-axis accel limit (m/s^2)
 
 
+class Quad2DBatch:
+    """M Quad2D models sharing one set of params, advanced together.
+
+    State is structure-of-arrays: a (4, M) float64 buffer whose rows px, py, vx, vy
+    are contiguous, so step() is a few whole-row NumPy ops with no loop over quads.
+    """
+
+    def __init__(self, m: int, params: QuadParams | None = None) -> None:
+        self.p = params or QuadParams()
+        self.state = np.zeros((4, int(m)))
+
+    @property
+    def px(self) -> np.ndarray:
+        return self.state[0]
+
+    @property
+    def py(self) -> np.ndarray:
+        return self.state[1]
+
+    @property
+    def vx(self) -> np.ndarray:
+        return self.state[2]
+
+    @property
+    def vy(self) -> np.ndarray:
+        return self.state[3]
+
+    def reset(self) -> None:
+        self.state[:] = 0.0
+
+    def step(self, dt: float, ax_cmd, ay_cmd) -> np.ndarray:
+        """quad2d_step for every quad; commands are scalars or length-M arrays.
+
+        Returns the (4, M) state buffer (rows px, py, vx, vy).
+        """
+        m = self.state.shape[1]
+        if HAVE_NUMBA and m >= PARALLEL_MIN_QUADS:
+            ax, ay = (
+                np.ascontiguousarray(np.broadcast_to(a, (m,)), np.float64) for a in (ax_cmd, ay_cmd)
+            )
+            quad2d_batch_step(self.state, dt, ax, ay, self.p.drag, self.p.accel_max)
+            return self.state
+        lim = self.p.accel_max
+        inv = 1.0 / (1.0 + self.p.drag * dt)
+        ax = np.clip(ax_cmd, -lim, lim)
+        ay = np.clip(ay_cmd, -lim, lim)
+        px, py, vx, vy = self.state
+        vx += ax * dt
+        vx *= inv
+        vy += ay * dt
+        vy *= inv
+        px += vx * dt
+        py += vy * dt
+        return self.state
+
+    @staticmethod
+    def rollout_drag_only(v0, drag, dt, n):
+        """Closed-form velocity after n unforced steps: v0 * (1 / (1 + drag*dt))**n.
+
+        Each step with zero command divides v by (1 + drag*dt), so this is the oracle
+        for step()/quad2d_step under pure drag. Arguments broadcast, so one call
+        evaluates a whole (drag, dt, n) sweep.
+        """
+        return np.asarray(v0) * (1.0 / (1.0 + np.asarray(drag) * dt)) ** np.asarray(n)
+
+
+def _state_field(i: int) -> property:
+    def get(self: Quad2D) -> float:
+        return float(self.s[i])
+
+    def set(self: Quad2D, v: float) -> None:
+        self.s[i] = v
+
+    return property(get, set)
+
+
 class Quad2D:
-    """Point-mass planar model with linear drag and accel saturation."""
+    """Point-mass planar model with linear drag and accel saturation, integrated with
+    semi-implicit Euler (see quad2d_step).
+
+    State lives in a flat float64 buffer ``s = [px, py, vx, vy]`` that quad2d_step
+    integrates in place; px/py/vx/vy are views onto it. ``s`` is the single column of
+    a one-quad Quad2DBatch, so batch and scalar code see the same memory.
+    """
+
+    px = _state_field(0)
+    py = _state_field(1)
+    vx = _state_field(2)
+    vy = _state_field(3)
 
     def __init__(self, params: QuadParams | None = None) -> None:
         self.p = params or QuadParams()
+        self.batch = Quad2DBatch(1, self.p)
+        self.s = self.batch.state[:, 0]
         self.reset()
 
     def reset(self, px: float = 0.0, py: float = 0.0, vx: float = 0.0, vy: float = 0.0) -> None:
-        self.px, self.py, self.vx, self.vy = px, py, vx, vy
+        self.s[:] = (px, py, vx, vy)
 
     def state(self) -> tuple[float, float, float, float]:
-        return self.px, self.py, self.vx, self.vy
+        px, py, vx, vy = self.s.tolist()
+        return px, py, vx, vy
 
     def step(self, dt: float, ax_cmd: float, ay_cmd: float) -> tuple[float, float, float, float]:
-        ax_cmd = _clamp(ax_cmd, -self.p.accel_max, self.p.accel_max)
-        ay_cmd = _clamp(ay_cmd, -self.p.accel_max, self.p.accel_max)
-        # apply linear drag on velocity
-        ax = ax_cmd - self.p.drag * self.vx
-        ay = ay_cmd - self.p.drag * self.vy
-        # integrate
-        self.vx += ax * dt
-        self.vy += ay * dt
-        self.px += self.vx * dt
-        self.py += self.vy * dt
+        quad2d_step(self.s, dt, float(ax_cmd), float(ay_cmd), self.p.drag, self.p.accel_max)
         return self.state()
+
+    def rollout(self, dt: float, ax_cmd: np.ndarray, ay_cmd: np.ndarray) -> np.ndarray:
+        """step() for each command pair in one call -> (N, 4) states after each step."""
+        ax = np.ascontiguousarray(ax_cmd, dtype=np.float64).reshape(-1)
+        ay = np.ascontiguousarray(ay_cmd, dtype=np.float64).reshape(-1)
+        if ax.shape != ay.shape:
+            raise ValueError("ax_cmd and ay_cmd must have the same length")
+        if not HAVE_NUMBA and self.p.drag == 0.0:
+            return _rollout_no_drag(self.s, dt, ax, ay, self.p.accel_max)
+        return quad2d_rollout(self.s, dt, ax, ay, self.p.drag, self.p.accel_max)
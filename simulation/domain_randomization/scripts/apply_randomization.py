@@ -10,27 +10,28 @@ from pathlib import Path
 import yaml
 
 
-def _sample_range(r):  # [lo, hi]
+def _sample_range(r, rng: random.Random):  # [lo, hi]
     lo, hi = float(r[0]), float(r[1])
-    return lo + random.random() * (hi - lo)
+    return lo + rng.random() * (hi - lo)
 
 
 def _choose(profile_name, cfg):
     return cfg["profiles"][profile_name]
 
 
-def main():
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--wind", default="simulation/domain_randomization/wind_profiles.yaml")
     ap.add_argument("--noise", default="simulation/domain_randomization/sensor_noise.yaml")
     ap.add_argument("--profile_wind", default="default")
     ap.add_argument("--profile_noise", default="default")
     ap.add_argument("--seed", type=int, default=None)
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     if args.seed is None:
         args.seed = int(time.time()) & 0xFFFF
-    random.seed(args.seed)
+    # same stream as random.seed(seed), without reseeding the global generator
+    rng = random.Random(args.seed)
 
     wind_cfg = yaml.safe_load(open(args.wind))
     noise_cfg = yaml.safe_load(open(args.noise))
@@ -40,15 +41,15 @@ def main():
     out = {
         "seed": args.seed,
         "wind": {
-            "wind_mps": _sample_range(w["wind_mps"]),
-            "gust_mps": _sample_range(w["gust_mps"]),
-            "direction_deg": _sample_range(w["direction_deg"]),
+            "wind_mps": _sample_range(w["wind_mps"], rng),
+            "gust_mps": _sample_range(w["gust_mps"], rng),
+            "direction_deg": _sample_range(w["direction_deg"], rng),
         },
         "sensor_noise": {
-            "imu_gyro_std": _sample_range(n["imu_gyro_std"]),
-            "imu_accel_std": _sample_range(n["imu_accel_std"]),
-            "gps_pos_std_m": _sample_range(n["gps_pos_std_m"]),
-            "cam_brightness": _sample_range(n["cam_brightness"]),
+            "imu_gyro_std": _sample_range(n["imu_gyro_std"], rng),
+            "imu_accel_std": _sample_range(n["imu_accel_std"], rng),
+            "gps_pos_std_m": _sample_range(n["gps_pos_std_m"], rng),
+            "cam_brightness": _sample_range(n["cam_brightness"], rng),
         },
     }
 
@@ -56,7 +57,8 @@ def main():
     j = Path("artifacts/randomization/last_profile.json")
     j.write_text(json.dumps(out, indent=2))
     print(json.dumps(out))
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -2,8 +2,13 @@
 from __future__ import annotations
 
 import math
+from dataclasses import dataclass
 from typing import Tuple
 
+import numpy as np
+
+from sim._jit import njit
+
 Vec2 = Tuple[float, float]
 
 
@@ -16,16 +21,132 @@ def _unit(v: Vec2) -> Vec2:
     return (v[0] / n, v[1] / n) if n > 1e-6 else (1.0, 0.0)
 
 
-def _dot(a: Vec2, b: Vec2) -> float:
-    return a[0] * b[0] + a[1] * b[1]
+@njit(cache=True)
+def _wrap_pi(a: float) -> float:
+    # Closed form into [-pi, pi) (an input of exactly +pi maps to -pi, the same heading).
+    return a - 2 * math.pi * math.floor((a + math.pi) / (2 * math.pi))
+
+
+@njit(cache=True)
+def l1_lateral_accel_on_leg_xy(
+    px: float,
+    py: float,
+    vx: float,
+    vy: float,
+    x0: float,
+    y0: float,
+    x1: float,
+    y1: float,
+    tx: float,
+    ty: float,
+    L: float,
+    L1_period: float,
+    damping: float,
+    a_max: float,
+) -> float:
+    """Scalar kernel on a precomputed leg: unit tangent (tx, ty) and length L of (x0, y0)->(x1, y1)."""
+    V = max(math.hypot(vx, vy), 1.0)
+    # classical L1 distance
+    L1_dist = max(V * L1_period / (2.0 * math.pi), 5.0)
 
+    if L < 1e-6:
+        # degenerate leg: just point at wp_next
+        Px = x1
+        Py = y1
+    else:
+        # projection of pos onto the infinite line, then clamp to segment
+        s = max(0.0, min(L, (px - x0) * tx + (py - y0) * ty))
+        # lookahead point along the segment
+        sP = min(L, s + L1_dist)
+        Px = x0 + tx * sP
+        Py = y0 + ty * sP
 
-def _wrap_pi(a: float) -> float:
-    while a > math.pi:
-        a -= 2 * math.pi
-    while a < -math.pi:
-        a += 2 * math.pi
-    return a
+    # desired bearing to lookahead point
+    psi_des = math.atan2(Py - py, Px - px)
+    psi = math.atan2(vy, vx)
+    eta = _wrap_pi(psi_des - psi)
+
+    # L1 normal-accel command; only sin(eta) is needed, so no cos/sin pair here
+    k = 2.0 * damping
+    a_cmd = (V * V / max(L1_dist, 1.0)) * (k * math.sin(eta))
+
+    # clamp
+    return min(a_max, max(-a_max, a_cmd))
+
+
+@njit(cache=True)
+def l1_lateral_accel_xy(
+    px: float,
+    py: float,
+    vx: float,
+    vy: float,
+    x0: float,
+    y0: float,
+    x1: float,
+    y1: float,
+    L1_period: float,
+    damping: float,
+    a_max: float,
+) -> float:
+    """Scalar kernel behind l1_lateral_accel: pos (px, py), vel (vx, vy), leg (x0, y0)->(x1, y1)."""
+    # leg vector + unit tangent
+    tx = x1 - x0
+    ty = y1 - y0
+    L = math.hypot(tx, ty)
+    if L >= 1e-6:
+        tx /= L
+        ty /= L
+    return l1_lateral_accel_on_leg_xy(
+        px, py, vx, vy, x0, y0, x1, y1, tx, ty, L, L1_period, damping, a_max
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class L1Leg:
+    """Leg wp_prev->wp_next with its unit tangent and length, computed once per leg switch."""
+
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+    tx: float
+    ty: float
+    L: float
+
+    @classmethod
+    def from_waypoints(cls, wp_prev: Vec2, wp_next: Vec2) -> L1Leg:
+        x0, y0 = float(wp_prev[0]), float(wp_prev[1])
+        x1, y1 = float(wp_next[0]), float(wp_next[1])
+        L = math.hypot(x1 - x0, y1 - y0)
+        tx, ty = ((x1 - x0) / L, (y1 - y0) / L) if L >= 1e-6 else (1.0, 0.0)
+        return cls(x0, y0, x1, y1, tx, ty, L)
+
+
+def l1_lateral_accel_on_leg(
+    pos: Vec2,
+    vel: Vec2,
+    leg: L1Leg,
+    L1_period: float = 12.0,
+    damping: float = 0.75,
+    a_max: float = 15.0,
+) -> float:
+    """l1_lateral_accel on a precomputed L1Leg (skips the per-tick tangent/length)."""
+    return l1_lateral_accel_on_leg_xy(
+        float(pos[0]),
+        float(pos[1]),
+        float(vel[0]),
+        float(vel[1]),
+        leg.x0,
+        leg.y0,
+        leg.x1,
+        leg.y1,
+        leg.tx,
+        leg.ty,
+        leg.L,
+        float(L1_period),
+        float(damping),
+        float(a_max),
+    )
 
 
 def l1_lateral_accel(
@@ -44,39 +165,57 @@ def l1_lateral_accel(
       3) command lateral accel to align velocity heading toward P
     Returns ay [m/s^2] (positive = turn left).
     """
-    V = max(_norm2(vel), 1.0)
-    # classical L1 distance
-    L1_dist = max(V * L1_period / (2.0 * math.pi), 5.0)
-
-    # leg vector + unit tangent
-    t_vec = (wp_next[0] - wp_prev[0], wp_next[1] - wp_prev[1])
-    L = _norm2(t_vec)
-    if L < 1e-6:
-        # degenerate leg: just point at wp_next
-        t_hat = (1.0, 0.0)
-        P = wp_next
-    else:
-        t_hat = (t_vec[0] / L, t_vec[1] / L)
-        # projection of pos onto the infinite line, then clamp to segment
-        w = (pos[0] - wp_prev[0], pos[1] - wp_prev[1])
-        s = max(0.0, min(L, _dot(w, t_hat)))
-        # closest point on the segment
-        # lookahead point along the segment
-        sP = min(L, s + L1_dist)
-        P = (wp_prev[0] + t_hat[0] * sP, wp_prev[1] + t_hat[1] * sP)
-
-    # desired bearing to lookahead point
-    psi_des = math.atan2(P[1] - pos[1], P[0] - pos[0])
-    psi = math.atan2(vel[1], vel[0])
-    eta = _wrap_pi(psi_des - psi)
-
-    # L1 normal-accel command
-    k = 2.0 * damping
-    a_cmd = (V * V / max(L1_dist, 1.0)) * (k * math.sin(eta))
-
-    # clamp
-    if a_cmd > a_max:
-        a_cmd = a_max
-    if a_cmd < -a_max:
-        a_cmd = -a_max
-    return a_cmd
+    return l1_lateral_accel_xy(
+        float(pos[0]),
+        float(pos[1]),
+        float(vel[0]),
+        float(vel[1]),
+        float(wp_prev[0]),
+        float(wp_prev[1]),
+        float(wp_next[0]),
+        float(wp_next[1]),
+        float(L1_period),
+        float(damping),
+        float(a_max),
+    )
+
+
+def l1_lateral_accel_batch(
+    pos: np.ndarray,
+    vel: np.ndarray,
+    wp_prev: np.ndarray,
+    wp_next: np.ndarray,
+    L1_period: float = 12.0,
+    damping: float = 0.75,
+    a_max: float = 15.0,
+) -> np.ndarray:
+    """
+    l1_lateral_accel for N vehicles at once: (N, 2) pos/vel/legs (any of them may be
+    a shared (2,) row) -> (N,) ay. Same math as the scalar kernel, as whole-array ops.
+    """
+    pos, vel = np.asarray(pos, dtype=float), np.asarray(vel, dtype=float)
+    wp_prev, wp_next = np.asarray(wp_prev, dtype=float), np.asarray(wp_next, dtype=float)
+    px, py = pos[..., 0], pos[..., 1]
+    vx, vy = vel[..., 0], vel[..., 1]
+    x0, y0 = wp_prev[..., 0], wp_prev[..., 1]
+    x1, y1 = wp_next[..., 0], wp_next[..., 1]
+
+    V = np.maximum(np.hypot(vx, vy), 1.0)
+    L1_dist = np.maximum(V * L1_period / (2.0 * math.pi), 5.0)
+
+    tx, ty = x1 - x0, y1 - y0
+    L = np.hypot(tx, ty)
+    leg = L >= 1e-6
+    tx = np.divide(tx, L, out=np.zeros_like(L), where=leg)
+    ty = np.divide(ty, L, out=np.zeros_like(L), where=leg)
+    s = np.clip((px - x0) * tx + (py - y0) * ty, 0.0, L)
+    sP = np.minimum(L, s + L1_dist)
+    # degenerate legs point straight at wp_next
+    Px = np.where(leg, x0 + tx * sP, x1)
+    Py = np.where(leg, y0 + ty * sP, y1)
+
+    eta = np.arctan2(Py - py, Px - px) - np.arctan2(vy, vx)
+    eta = eta - 2 * math.pi * np.floor((eta + math.pi) / (2 * math.pi))
+
+    a_cmd = (V * V / np.maximum(L1_dist, 1.0)) * (2.0 * damping * np.sin(eta))
+    return np.clip(a_cmd, -a_max, a_max)
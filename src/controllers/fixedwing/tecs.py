@@ -11,8 +11,4 @@ def tecs_vertical_speed_cmd(
     """
     vdot_cmd = kp_alt * (alt_cmd - alt)
     limit = max(v * vdot_lim_frac, 1.0)
-    if vdot_cmd > limit:
-        vdot_cmd = limit
-    if vdot_cmd < -limit:
-        vdot_cmd = -limit
-    return float(vdot_cmd)
+    return float(min(limit, max(-limit, vdot_cmd)))
@@ -3,6 +3,30 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
+def lqr_axis_step(
+    e_pos: float,
+    v_rel: float,
+    i_prev: float,
+    kx: float,
+    kv: float,
+    ki: float,
+    i_limit: float,
+    accel_max: float,
+    dt: float,
+) -> tuple[float, float]:
+    """One axis of the state-feedback law with clamped integrator and output -> (u, i_new)."""
+    if ki > 0.0:
+        # clamp integrator
+        i_new = min(i_limit, max(-i_limit, i_prev + e_pos * dt))
+    else:
+        i_new = 0.0
+
+    u = kx * e_pos + kv * (-v_rel) + ki * i_new
+
+    # clamp accel
+    return min(accel_max, max(-accel_max, u)), i_new
+
+
 @dataclass
 class LQRGains:
     """Axis gains for position-velocity state feedback (x,v) with optional integral."""
@@ -41,29 +65,6 @@ class LQRPos2D:
         self.ix = 0.0
         self.iy = 0.0
 
-    def _axis(
-        self, e_pos: float, v_rel: float, i_prev: float, g: LQRGains, dt: float
-    ) -> tuple[float, float]:
-        if g.ki > 0.0:
-            i_new = i_prev + e_pos * dt
-            # clamp integrator
-            if i_new > self.lim.i_limit:
-                i_new = self.lim.i_limit
-            elif i_new < -self.lim.i_limit:
-                i_new = -self.lim.i_limit
-        else:
-            i_new = 0.0
-
-        u = g.kx * e_pos + g.kv * (-v_rel) + g.ki * i_new
-
-        # clamp accel
-        if u > self.lim.accel_max:
-            u = self.lim.accel_max
-        elif u < -self.lim.accel_max:
-            u = -self.lim.accel_max
-
-        return u, i_new
-
     def step(
         self,
         dt: float,
@@ -72,10 +73,30 @@ class LQRPos2D:
         target_pos: tuple[float, float],
         target_vel: tuple[float, float] = (0.0, 0.0),
     ) -> tuple[float, float]:
-        ex = target_pos[0] - pos[0]
-        ey = target_pos[1] - pos[1]
-        vx_rel = vel[0] - target_vel[0]
-        vy_rel = vel[1] - target_vel[1]
-        ax, self.ix = self._axis(ex, vx_rel, self.ix, self.gx, dt)
-        ay, self.iy = self._axis(ey, vy_rel, self.iy, self.gy, dt)
+        # Gains/limits are read into locals once per tick (not baked in at init, so
+        # edits to gx/gy/lim still take effect).
+        gx, gy, lim = self.gx, self.gy, self.lim
+        i_lim, a_lim = lim.i_limit, lim.accel_max
+        ax, self.ix = lqr_axis_step(
+            target_pos[0] - pos[0],
+            vel[0] - target_vel[0],
+            self.ix,
+            gx.kx,
+            gx.kv,
+            gx.ki,
+            i_lim,
+            a_lim,
+            dt,
+        )
+        ay, self.iy = lqr_axis_step(
+            target_pos[1] - pos[1],
+            vel[1] - target_vel[1],
+            self.iy,
+            gy.kx,
+            gy.kv,
+            gy.ki,
+            i_lim,
+            a_lim,
+            dt,
+        )
         return ax, ay
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from math import atan2, cos, sin, sqrt
+from math import sqrt
 
 
 @dataclass
@@ -13,6 +13,44 @@ class PPConfig:
     vel_d: float = 0.3
 
 
+def _pp_desired_velocity(
+    px: float, py: float, wx: float, wy: float, desired_speed: float
+) -> tuple[float, float]:
+    """desired_speed along the unit vector from (px, py) to waypoint (wx, wy)."""
+    dx = wx - px
+    dy = wy - py
+    # keep it trig-free: no atan2 -> cos/sin round trip
+    n = sqrt(dx * dx + dy * dy)
+    if n < 1e-9:
+        return 0.0, 0.0
+    s = desired_speed / n
+    return s * dx, s * dy
+
+
+def _pp_accel_cmd_xy(
+    px: float,
+    py: float,
+    vx: float,
+    vy: float,
+    wx: float,
+    wy: float,
+    desired_speed: float,
+    accel_limit: float,
+    vel_p: float,
+) -> tuple[float, float]:
+    """Scalar core of PurePursuit2D.accel_cmd: pos (px, py), vel (vx, vy), waypoint (wx, wy)."""
+    dvx, dvy = _pp_desired_velocity(px, py, wx, wy, desired_speed)
+    ax = vel_p * (dvx - vx)
+    ay = vel_p * (dvy - vy)
+    # clamp accel
+    mag = sqrt(ax * ax + ay * ay)
+    if mag > accel_limit and mag > 1e-6:
+        scale = accel_limit / mag
+        ax *= scale
+        ay *= scale
+    return ax, ay
+
+
 class PurePursuit2D:
     """
     Simple 2D pure-pursuit target generator.
@@ -32,25 +70,21 @@ class PurePursuit2D:
     def desired_velocity(
         self, pos: tuple[float, float], next_wp: tuple[float, float]
     ) -> tuple[float, float]:
-        dx = next_wp[0] - pos[0]
-        dy = next_wp[1] - pos[1]
-        ang = atan2(dy, dx)
-        return (self.cfg.desired_speed * cos(ang), self.cfg.desired_speed * sin(ang))
+        return _pp_desired_velocity(pos[0], pos[1], next_wp[0], next_wp[1], self.cfg.desired_speed)
 
     def accel_cmd(
         self, pos: tuple[float, float], vel: tuple[float, float], next_wp: tuple[float, float]
     ) -> tuple[float, float]:
-        dvx, dvy = self.desired_velocity(pos, next_wp)
-        ex_vx = dvx - vel[0]
-        ex_vy = dvy - vel[1]
-        ax = (
-            self.cfg.vel_p * ex_vx - self.cfg.vel_d * 0.0
-        )  # no vel-derivative here (we don't keep a history)
-        ay = self.cfg.vel_p * ex_vy - self.cfg.vel_d * 0.0
-        # clamp accel
-        mag = sqrt(ax * ax + ay * ay)
-        if mag > self.cfg.accel_limit and mag > 1e-6:
-            scale = self.cfg.accel_limit / mag
-            ax *= scale
-            ay *= scale
-        return ax, ay
+        # P on velocity only: no vel-derivative term here (we don't keep a history)
+        cfg = self.cfg
+        return _pp_accel_cmd_xy(
+            pos[0],
+            pos[1],
+            vel[0],
+            vel[1],
+            next_wp[0],
+            next_wp[1],
+            cfg.desired_speed,
+            cfg.accel_limit,
+            cfg.vel_p,
+        )
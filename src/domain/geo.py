@@ -3,40 +3,191 @@ from __future__ import annotations
 
 from typing import Iterable, List, Tuple
 
+import numpy as np
+
+from sim._jit import njit
+
 Pt = Tuple[int, int]
 
 
-def point_in_polygon(p: Pt, poly: Iterable[Pt]) -> bool:
-    """Ray-cast test for 2D geofence polygons on grid coordinates."""
-    x, y = p
-    poly = list(poly)
-    n = len(poly)
+def _poly_array(poly) -> np.ndarray:
+    """(n, 2) float64 vertex array. A C-contiguous float64 (n, 2) array is returned as
+    is; other inputs (lists of tuples, ...) are converted, an O(n) copy per call."""
+    if not isinstance(poly, (list, tuple, np.ndarray)):
+        poly = list(poly)
+    return np.ascontiguousarray(poly, dtype=np.float64).reshape(-1, 2)
+
+
+@njit(cache=True)
+def _pip_kernel(x: float, y: float, v: np.ndarray) -> bool:
+    n = v.shape[0]
     inside = False
+    if n == 0:
+        return inside
+    # PNPOLY-style rolling index: edge (j -> i) with j the previous vertex, no modulo
+    x1 = v[n - 1, 0]
+    y1 = v[n - 1, 1]
     for i in range(n):
-        x1, y1 = poly[i]
-        x2, y2 = poly[(i + 1) % n]
+        x2 = v[i, 0]
+        y2 = v[i, 1]
         # check edges that straddle the y of point
         if (y1 > y) != (y2 > y):
             # x of intersection of the edge with scanline at y
             xin = x1 + (x2 - x1) * (y - y1) / (y2 - y1)
             if xin >= x:
                 inside = not inside
+        x1 = x2
+        y1 = y2
     return inside
 
 
-def bresenham(a: Pt, b: Pt) -> List[Pt]:
-    x0, y0 = a
-    x1, y1 = b
+def point_in_polygon(p: Pt, poly: Iterable[Pt]) -> bool:
+    """Ray-cast test for 2D geofence polygons on grid coordinates.
+
+    For repeated queries against one polygon, pass it as a float64 (n, 2) array
+    (np.asarray(poly, dtype=float) once) so no per-call conversion happens.
+    """
+    return bool(_pip_kernel(float(p[0]), float(p[1]), _poly_array(poly)))
+
+
+def point_in_polygon_many(pts, poly: Iterable[Pt]) -> np.ndarray:
+    """Vectorized point_in_polygon over (M, 2) points; returns an (M,) bool array."""
+    v = _poly_array(poly)
+    xs, ys = v[:, 0], v[:, 1]
+    P = np.asarray(pts, dtype=np.float64).reshape(-1, 2)
+    px, py = P[:, 0:1], P[:, 1:2]  # (M, 1) against (n,) edges
+    x1, y1 = xs, ys
+    x2, y2 = np.roll(xs, -1), np.roll(ys, -1)
+    straddle = (y1 > py) != (y2 > py)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        xin = x1 + (x2 - x1) * (py - y1) / (y2 - y1)
+    crossings = np.count_nonzero(straddle & (xin >= px), axis=1)
+    return crossings % 2 == 1
+
+
+@njit(cache=True)
+def _pip_edges(
+    x: float,
+    y: float,
+    ex1: np.ndarray,
+    ey1: np.ndarray,
+    ex2: np.ndarray,
+    ey2: np.ndarray,
+    idx: np.ndarray,
+) -> bool:
+    """_pip_kernel restricted to the edges listed in idx."""
+    inside = False
+    for k in idx:
+        if (ey1[k] > y) != (ey2[k] > y):
+            xin = ex1[k] + (ex2[k] - ex1[k]) * (y - ey1[k]) / (ey2[k] - ey1[k])
+            if xin >= x:
+                inside = not inside
+    return inside
+
+
+_TILE_OUTSIDE, _TILE_INSIDE, _TILE_BOUNDARY = 0, 1, 2
+
+
+class Geofence:
+    """
+    point_in_polygon against a fixed polygon, cached on a granularity x granularity
+    tile grid over its bbox. Tiles no edge touches are wholly inside or outside and
+    answer immediately; boundary tiles ray-cast only against the edges that can
+    cross a ray from inside the tile (those overlapping its row band and reaching
+    past its left side), so answers match point_in_polygon exactly.
+    """
+
+    def __init__(self, poly: Iterable[Pt], granularity: int = 20):
+        v = _poly_array(poly)
+        xs, ys = v[:, 0], v[:, 1]
+        g = max(1, int(granularity))
+        self.g = g
+        self.ex1, self.ey1 = xs, ys
+        self.ex2, self.ey2 = np.roll(xs, -1), np.roll(ys, -1)
+        self.x0, self.x1 = float(xs.min()), float(xs.max())
+        self.y0, self.y1 = float(ys.min()), float(ys.max())
+        self.tw = (self.x1 - self.x0) / g or 1.0
+        self.th = (self.y1 - self.y0) / g or 1.0
+
+        e_xmin, e_xmax = np.minimum(self.ex1, self.ex2), np.maximum(self.ex1, self.ex2)
+        e_ymin, e_ymax = np.minimum(self.ey1, self.ey2), np.maximum(self.ey1, self.ey2)
+        # tile rects are padded so float rounding in the tile index stays conservative
+        eps = 1e-9 * (1.0 + self.x1 - self.x0 + self.y1 - self.y0)
+        self.state = np.empty((g, g), dtype=np.int8)  # [row (y), col (x)]
+        start = [0]
+        tile_edges = []
+        for j in range(g):
+            ylo = self.y0 + j * self.th - eps
+            yhi = self.y0 + (j + 1) * self.th + eps
+            band = (e_ymax >= ylo) & (e_ymin <= yhi)
+            for i in range(g):
+                xlo = self.x0 + i * self.tw - eps
+                xhi = self.x0 + (i + 1) * self.tw + eps
+                reach = band & (e_xmax >= xlo)
+                if (reach & (e_xmin <= xhi)).any():
+                    local = np.flatnonzero(reach)
+                    self.state[j, i] = _TILE_BOUNDARY
+                else:
+                    local = np.empty(0, dtype=np.int64)
+                    cx, cy = 0.5 * (xlo + xhi), 0.5 * (ylo + yhi)
+                    inside = _pip_kernel(cx, cy, v)
+                    self.state[j, i] = _TILE_INSIDE if inside else _TILE_OUTSIDE
+                tile_edges.append(local)
+                start.append(start[-1] + local.size)
+        self.tile_start = np.asarray(start, dtype=np.int64)
+        self.tile_edges = np.concatenate(tile_edges).astype(np.int64)
+
+    def inside(self, p: Pt) -> bool:
+        x, y = float(p[0]), float(p[1])
+        if x < self.x0 or x > self.x1 or y < self.y0 or y > self.y1:
+            return False
+        i = min(int((x - self.x0) / self.tw), self.g - 1)
+        j = min(int((y - self.y0) / self.th), self.g - 1)
+        st = self.state[j, i]
+        if st != _TILE_BOUNDARY:
+            return st == _TILE_INSIDE
+        k = j * self.g + i
+        idx = self.tile_edges[self.tile_start[k] : self.tile_start[k + 1]]
+        return bool(_pip_edges(x, y, self.ex1, self.ey1, self.ex2, self.ey2, idx))
+
+
+@njit(cache=True)
+def _bresenham_fill(x0: int, y0: int, x1: int, y1: int, out: np.ndarray) -> int:
+    """Write the cells of the line a->b into out (at least max(|dx|, |dy|) + 1 rows)."""
+    dx = abs(x1 - x0)
+    dy = -abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    err = dx + dy
+    n = 0
+    while True:
+        out[n, 0] = x0
+        out[n, 1] = y0
+        n += 1
+        if x0 == x1 and y0 == y1:
+            return n
+        e2 = 2 * err
+        if e2 >= dy:
+            err += dy
+            x0 += sx
+        if e2 <= dx:
+            err += dx
+            y0 += sy
+
+
+@njit(cache=True)
+def _los_free(x0: int, y0: int, x1: int, y1: int, occ: np.ndarray) -> bool:
+    """Walk the Bresenham line a->b over occ[y, x], stopping at the first obstacle."""
     dx = abs(x1 - x0)
     dy = -abs(y1 - y0)
     sx = 1 if x0 < x1 else -1
     sy = 1 if y0 < y1 else -1
     err = dx + dy
-    pts = []
     while True:
-        pts.append((x0, y0))
+        if occ[y0, x0] == 1:
+            return False
         if x0 == x1 and y0 == y1:
-            break
+            return True
         e2 = 2 * err
         if e2 >= dy:
             err += dy
@@ -44,7 +195,14 @@ def bresenham(a: Pt, b: Pt) -> List[Pt]:
         if e2 <= dx:
             err += dx
             y0 += sy
-    return pts
+
+
+def bresenham(a: Pt, b: Pt) -> List[Pt]:
+    x0, y0 = int(a[0]), int(a[1])
+    x1, y1 = int(b[0]), int(b[1])
+    out = np.empty((max(abs(x1 - x0), abs(y1 - y0)) + 1, 2), dtype=np.int64)
+    n = _bresenham_fill(x0, y0, x1, y1, out)
+    return list(map(tuple, out[:n].tolist()))
 
 
 def line_of_sight_free(a: Pt, b: Pt, occ_grid) -> bool:
@@ -52,6 +210,13 @@ def line_of_sight_free(a: Pt, b: Pt, occ_grid) -> bool:
     True if the straight line a->b is free of obstacles on a binary occupancy grid.
     occ_grid[y][x] == 1 means obstacle.
     """
+    # Only ndarray grids take the kernel: converting a list-of-lists grid per query is
+    # O(H*W) and costs more than the ray. Callers that query often should pass an array.
+    if isinstance(occ_grid, np.ndarray) and occ_grid.ndim == 2:
+        h, w = occ_grid.shape
+        # The kernel does no bounds checks; the line stays inside the endpoints' bbox.
+        if all(0 <= p[0] < w and 0 <= p[1] < h for p in (a, b)):
+            return bool(_los_free(int(a[0]), int(a[1]), int(b[0]), int(b[1]), occ_grid))
     for x, y in bresenham(a, b):
         if occ_grid[y][x] == 1:
             return False
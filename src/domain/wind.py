@@ -6,6 +6,10 @@ import random
 from dataclasses import dataclass
 from typing import Tuple
 
+import numpy as np
+
+from sim._jit import njit
+
 
 @dataclass
 class OUParams:
@@ -14,6 +18,27 @@ class OUParams:
     mean: float = 0.0
 
 
+def _ou_step(state: float, mean: float, a: float, sd: float, z: float) -> float:
+    """One exact OU update given a standard-normal draw z."""
+    return mean + a * (state - mean) + sd * z
+
+
+_ou_step_jit = njit(cache=True)(_ou_step)
+
+
+@njit(cache=True)
+def _ou_rollout(
+    state: np.ndarray, mean: np.ndarray, a: np.ndarray, sd: np.ndarray, z: np.ndarray
+) -> np.ndarray:
+    """Run the per-axis OU recursion over z (N, k); advances state (k,) in place."""
+    out = np.empty_like(z)
+    for i in range(z.shape[0]):
+        for j in range(z.shape[1]):
+            state[j] = _ou_step_jit(state[j], mean[j], a[j], sd[j], z[i, j])
+            out[i, j] = state[j]
+    return out
+
+
 class OUWind1D:
     """Ornstein–Uhlenbeck wind component with exact discretization."""
 
@@ -21,15 +46,26 @@ class OUWind1D:
         self.p = p
         self.state = p.mean
         self.rng = random.Random(seed)
+        # (a, sd) for the last dt seen; sims step at a fixed dt almost always
+        self._cached_dt = -1.0
+        self._a = 1.0
+        self._sd = 0.0
+
+    def coeffs(self, dt: float) -> Tuple[float, float]:
+        """Exact-discretization decay a and innovation std sd for a dt > 0 step."""
+        if dt != self._cached_dt:
+            a = math.exp(-dt / self.p.tau_s)
+            var = self.p.sigma**2 * (1.0 - a * a)
+            self._a, self._sd = a, math.sqrt(max(1e-12, var))
+            self._cached_dt = dt
+        return self._a, self._sd
 
     def step(self, dt: float) -> float:
         if dt <= 0:
             return self.state
         # exact OU update
-        a = math.exp(-dt / self.p.tau_s)
-        var = self.p.sigma**2 * (1.0 - a * a)
-        noise = self.rng.gauss(0.0, math.sqrt(max(1e-12, var)))
-        self.state = self.p.mean + a * (self.state - self.p.mean) + noise
+        a, sd = self.coeffs(dt)
+        self.state = _ou_step(self.state, self.p.mean, a, sd, self.rng.gauss(0.0, 1.0))
         return self.state
 
 
@@ -45,6 +81,24 @@ class WindField:
         self.wx = OUWind1D(p_xy, seed=seed + 1)
         self.wy = OUWind1D(p_xy, seed=seed + 2)
         self.wz = OUWind1D(p_z, seed=seed + 3)
+        self.np_rng = np.random.default_rng(seed)
 
     def sample(self, dt: float) -> Tuple[float, float, float]:
         return (self.wx.step(dt), self.wy.step(dt), self.wz.step(dt))
+
+    def sample_trajectory(self, N: int, dt: float) -> np.ndarray:
+        """
+        Sample N steps of (wx, wy, wz) at once as an (N, 3) array.
+        Draws come from self.np_rng, so the sequence differs from N calls to sample();
+        the axis states are advanced, so online sampling continues from the last row.
+        """
+        axes = (self.wx, self.wy, self.wz)
+        state = np.array([w.state for w in axes], dtype=float)
+        if dt <= 0:
+            return np.tile(state, (N, 1))
+        a, sd = np.array([w.coeffs(dt) for w in axes]).T
+        mean = np.array([w.p.mean for w in axes], dtype=float)
+        out = _ou_rollout(state, mean, a, sd, self.np_rng.standard_normal((N, 3)))
+        for w, s in zip(axes, state.tolist()):
+            w.state = s
+        return out
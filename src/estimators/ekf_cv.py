@@ -6,6 +6,9 @@ from dataclasses import dataclass
 
 import numpy as np
 
+EARTH_R_M = 6378137.0  # WGS-84 equatorial radius
+DEG2RAD = math.pi / 180.0
+
 
 @dataclass
 class EKFState:
@@ -14,49 +17,101 @@ class EKFState:
 
 
 class EKFCV:
-    def __init__(self, q_pos=0.5, q_vel=0.8, r_pos=2.0):
+    """
+    Constant-velocity EKF on [x y z vx vy vz] with position measurements.
+    Runs in float32 by default: ~7 significant digits is sub-millimetre at km-scale
+    local coordinates, far below the r_pos measurement noise. Pass dtype=np.float64
+    for full precision.
+    """
+
+    def __init__(self, q_pos=0.5, q_vel=0.8, r_pos=2.0, dtype=np.float32):
         self.q_pos, self.q_vel, self.r_pos = q_pos, q_vel, r_pos
-        self._I = np.eye(6)
+        self.dtype = np.dtype(dtype)
+        self._I = np.eye(6, dtype=self.dtype)
+        # Scratch buffers reused by predict/update_pos so a step does not allocate them.
+        self._y = np.zeros((3, 1), dtype=self.dtype)
+        self._S = np.zeros((3, 3), dtype=self.dtype)
+        self._K = np.zeros((6, 3), dtype=self.dtype)
+        self._KHP = np.zeros((6, 6), dtype=self.dtype)
+        # _F/_Q write their dt-dependent entries into these instead of rebuilding 6x6s
+        self._F_buf = np.eye(6, dtype=self.dtype)
+        self._Q_buf = np.zeros((6, 6), dtype=self.dtype)
 
     def init(self, x0: float, y0: float, z0: float) -> EKFState:
-        x = np.zeros((6, 1))
+        x = np.zeros((6, 1), dtype=self.dtype)
         x[0, 0], x[1, 0], x[2, 0] = x0, y0, z0
-        P = np.diag([10, 10, 10, 5, 5, 5]).astype(float)
+        P = np.diag([10, 10, 10, 5, 5, 5]).astype(self.dtype)
         return EKFState(x=x, P=P)
 
+    # _F/_Q return a shared buffer that the next call overwrites; copy to keep one.
+    # predict applies both in closed form and does not call them.
     def _F(self, dt: float) -> np.ndarray:
-        F = np.eye(6)
-        F[0, 3] = dt
-        F[1, 4] = dt
-        F[2, 5] = dt
+        F = self._F_buf
+        F[0, 3] = F[1, 4] = F[2, 5] = dt
         return F
 
     def _Q(self, dt: float) -> np.ndarray:
-        return np.diag([self.q_pos * dt] * 3 + [self.q_vel * dt] * 3).astype(float)
+        d = np.einsum("ii->i", self._Q_buf)
+        d[:3] = self.q_pos * dt
+        d[3:] = self.q_vel * dt
+        return self._Q_buf
 
     def predict(self, st: EKFState, dt: float) -> EKFState:
-        F = self._F(dt)
-        st.x = F @ st.x
-        st.P = F @ st.P @ F.T + self._Q(dt)
+        # F = [[I, dt*I], [0, I]] (see _F), so F x and F P F^T reduce to block updates:
+        # P <- [[Pxx + dt(Pxv + Pvx) + dt^2 Pvv, Pxv + dt Pvv], [Pvx + dt Pvv, Pvv]] + Q
+        x, P = st.x, st.P
+        x[:3] += dt * x[3:]
+        P[:3, :] += dt * P[3:, :]
+        P[:, :3] += dt * P[:, 3:]
+        d = np.einsum("ii->i", P)  # writable view of the diagonal; Q is diagonal
+        d[:3] += self.q_pos * dt
+        d[3:] += self.q_vel * dt
         return st
 
     def update_pos(self, st: EKFState, zx: float, zy: float, zz: float) -> EKFState:
-        H = np.zeros((3, 6))
-        H[0, 0] = H[1, 1] = H[2, 2] = 1
-        R = np.diag([self.r_pos] * 3).astype(float)
-        z = np.array([[zx], [zy], [zz]])
-        y = z - (H @ st.x)
-        S = H @ st.P @ H.T + R
-        K = st.P @ H.T @ np.linalg.inv(S)
-        st.x = st.x + K @ y
-        st.P = (self._I - K @ H) @ st.P
+        # H = [I, 0]: H x, H P and P H^T are the position rows/columns of x and P.
+        x, P = st.x, st.P
+        y = self._y
+        y[0, 0] = zx - x[0, 0]
+        y[1, 0] = zy - x[1, 0]
+        y[2, 0] = zz - x[2, 0]
+        S = self._S
+        S[:] = P[:3, :3]
+        np.einsum("ii->i", S)[:] += self.r_pos
+        # K = P H^T S^-1, via a solve on the symmetric S instead of an explicit inverse
+        K = self._K
+        PHt = P[:, :3].T
+        # P is PSD, so S's eigenvalues lie in [r_pos, trace(S)]: a cheap bound on cond(S).
+        # Solve ill-conditioned gains in float64 rather than the working dtype.
+        if self.dtype != np.float64 and np.trace(S) > 1e6 * self.r_pos:
+            K[:] = np.linalg.solve(S.astype(np.float64), PHt.astype(np.float64)).T
+        else:
+            K[:] = np.linalg.solve(S, PHt).T
+        x += K @ y
+        P -= np.matmul(K, P[:3, :], out=self._KHP)
         return st
 
 
 def geodetic_to_local_xy(lat0, lon0, lat, lon):
-    R = 6378137.0
-    dlat = math.radians(lat - lat0)
-    dlon = math.radians(lon - lon0)
-    x = R * dlon * math.cos(math.radians((lat + lat0) / 2.0))
-    y = R * dlat
+    dlat = (lat - lat0) * DEG2RAD
+    dlon = (lon - lon0) * DEG2RAD
+    x = EARTH_R_M * dlon * math.cos(((lat + lat0) / 2.0) * DEG2RAD)
+    y = EARTH_R_M * dlat
     return x, y
+
+
+def geodetic_to_local_xy_batch(lat0, lon0, lats, lons, fixed_lat: bool = False):
+    """
+    geodetic_to_local_xy over arrays of lats/lons -> (xs, ys) arrays.
+    fixed_lat=True uses cos(lat0) for every point (one cos per trajectory), which is
+    adequate for flights spanning a small latitude range.
+    """
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    dlat = (lats - lat0) * DEG2RAD
+    dlon = (lons - lon0) * DEG2RAD
+    if fixed_lat:
+        c = math.cos(lat0 * DEG2RAD)
+    else:
+        c = np.cos(((lats + lat0) / 2.0) * DEG2RAD)
+    return EARTH_R_M * dlon * c, EARTH_R_M * dlat
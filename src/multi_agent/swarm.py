@@ -1,20 +1,16 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import List, Tuple
 
 import numpy as np
 
-Vec2 = Tuple[float, float]
-
+try:
+    from scipy.optimize import linear_sum_assignment  # type: ignore
+except Exception:
+    linear_sum_assignment = None
 
-@dataclass
-class Agent:
-    x: float
-    y: float
-    vx: float = 0.0
-    vy: float = 0.0
+Vec2 = Tuple[float, float]
 
 
 def _clip(v: np.ndarray, vmax: float) -> np.ndarray:
@@ -22,6 +18,14 @@ def _clip(v: np.ndarray, vmax: float) -> np.ndarray:
     return v if n <= vmax or n == 0 else v * (vmax / n)
 
 
+def _clip_rows(vx: np.ndarray, vy: np.ndarray, vmax: float) -> tuple[np.ndarray, np.ndarray]:
+    """_clip applied to each (vx[i], vy[i]) row."""
+    n = np.sqrt(vx * vx + vy * vy)
+    over = (n > vmax) & (n != 0)
+    scale = np.where(over, vmax / np.where(over, n, 1.0), 1.0)
+    return vx * scale, vy * scale
+
+
 def simulate_swarm(
     n_agents: int,
     offsets: List[Vec2],
@@ -44,7 +48,13 @@ def simulate_swarm(
     assert n_agents >= 1
     assert len(offsets) >= max(0, n_agents - 1)
 
-    agents = [Agent(x=0.0, y=0.0)] + [Agent(x=off[0], y=off[1]) for off in offsets[: n_agents - 1]]
+    # structure-of-arrays agent state; followers are rows 1..n-1
+    off = np.asarray(offsets[: n_agents - 1], dtype=float).reshape(-1, 2)
+    X = np.zeros(n_agents)
+    Y = np.zeros(n_agents)
+    X[1:], Y[1:] = off[:, 0], off[:, 1]
+    VX = np.zeros(n_agents)
+    VY = np.zeros(n_agents)
     trace = np.zeros((steps, n_agents, 2), dtype=float)
     wp_idx = 0
     eps = 1e-6
@@ -52,94 +62,101 @@ def simulate_swarm(
 
     for k in range(steps):
         # leader to waypoint
-        leader = agents[0]
         if wp_idx < len(waypoints):
             gx, gy = waypoints[wp_idx]
-            d = np.array([gx - leader.x, gy - leader.y], dtype=float)
+            d = np.array([gx - X[0], gy - Y[0]], dtype=float)
             if np.linalg.norm(d) < 0.5 and wp_idx < len(waypoints) - 1:
                 wp_idx += 1
                 gx, gy = waypoints[wp_idx]
-                d = np.array([gx - leader.x, gy - leader.y], dtype=float)
+                d = np.array([gx - X[0], gy - Y[0]], dtype=float)
             v_lead = _clip(kp_leader * d, vmax)
         else:
             v_lead = np.zeros(2)
-        leader.vx, leader.vy = float(v_lead[0]), float(v_lead[1])
-
-        # followers: formation + barrier repulsion
-        for i in range(1, n_agents):
-            ag = agents[i]
-            ox, oy = offsets[i - 1]
-            des = np.array([leader.x + ox - ag.x, leader.y + oy - ag.y], dtype=float)
-            v = kp_form * des
-
-            rep = np.zeros(2, dtype=float)
-            for j in range(n_agents):
-                if j == i:
-                    continue
-                other = agents[j]
-                diff = np.array([ag.x - other.x, ag.y - other.y], dtype=float)
-                dist = float(np.linalg.norm(diff))
-                if 0.0 < dist < r_avoid:
-                    # barrier-style strength: grows rapidly as dist -> 0
-                    strength = k_avoid * max(0.0, (r_avoid / (dist + eps) - 1.0))
-                    rep += (diff / (dist + eps)) * strength
-
-            v = _clip(v + rep, vmax)
-
-            # soft safety: if too close to anyone and still closing, push directly away
-            for j in range(n_agents):
-                if j == i:
-                    continue
-                other = agents[j]
-                diff = np.array([ag.x - other.x, ag.y - other.y], dtype=float)
-                dist = float(np.linalg.norm(diff))
-                if 0.0 < dist < r_safe:
-                    push = (diff / (dist + eps)) * (k_avoid * (r_safe - dist) / (dist + eps))
-                    v = _clip(v + push, vmax)
-
-            ag.vx, ag.vy = float(v[0]), float(v[1])
+        VX[0], VY[0] = v_lead
+
+        if n_agents > 1:
+            # followers: formation + barrier repulsion, all at once.
+            # DX/DY/D are [follower, agent]; a follower's own column has D == 0 and so
+            # drops out of every 0 < D < r mask, like the j == i skip did.
+            vx = kp_form * (X[0] + off[:, 0] - X[1:])
+            vy = kp_form * (Y[0] + off[:, 1] - Y[1:])
+            DX = X[1:, None] - X[None, :]
+            DY = Y[1:, None] - Y[None, :]
+            D = np.sqrt(DX * DX + DY * DY)
+            Deps = D + eps
+
+            near = (D > 0.0) & (D < r_avoid)
+            # barrier-style strength: grows rapidly as dist -> 0
+            strength = k_avoid * np.maximum(0.0, r_avoid / Deps - 1.0)
+            vx = vx + np.where(near, DX / Deps * strength, 0.0).sum(axis=1)
+            vy = vy + np.where(near, DY / Deps * strength, 0.0).sum(axis=1)
+            vx, vy = _clip_rows(vx, vy, vmax)
+
+            # soft safety: if too close to anyone and still closing, push directly away.
+            # Each push is clipped before the next, so neighbours are applied in order.
+            close = (D > 0.0) & (D < r_safe)
+            push = k_avoid * (r_safe - D) / Deps
+            for j in np.flatnonzero(close.any(axis=0)):
+                m = close[:, j]
+                px, py = _clip_rows(
+                    vx + DX[:, j] / Deps[:, j] * push[:, j],
+                    vy + DY[:, j] / Deps[:, j] * push[:, j],
+                    vmax,
+                )
+                vx = np.where(m, px, vx)
+                vy = np.where(m, py, vy)
+
+            VX[1:], VY[1:] = vx, vy
 
         # integrate
-        for i, ag in enumerate(agents):
-            ag.x += ag.vx * dt
-            ag.y += ag.vy * dt
-            trace[k, i, 0] = ag.x
-            trace[k, i, 1] = ag.y
+        X += VX * dt
+        Y += VY * dt
+        trace[k, :, 0] = X
+        trace[k, :, 1] = Y
 
     return trace
 
 
 def min_pairwise_distance(trace: np.ndarray) -> float:
     s, n, _ = trace.shape
-    m = float("inf")
-    for k in range(s):
-        P = trace[k]
-        for i in range(n):
-            for j in range(i + 1, n):
-                d = float(np.hypot(P[i, 0] - P[j, 0], P[i, 1] - P[j, 1]))
-                if d < m:
-                    m = d
-    return 0.0 if m == float("inf") else m
-
-
-def auction_assign(agents_xy: List[Vec2], goals_xy: List[Vec2]) -> List[Tuple[int, int]]:
-    """Greedy market-based assignment: iteratively match closest (agent, goal)."""
-    A = list(range(len(agents_xy)))
-    G = list(range(len(goals_xy)))
+    if s == 0 or n < 2:
+        return 0.0
+    # all frames x all unordered pairs in one block: (s, n*(n-1)/2) distances
+    i, j = np.triu_indices(n, k=1)
+    d = np.hypot(trace[:, i, 0] - trace[:, j, 0], trace[:, i, 1] - trace[:, j, 1])
+    m = float(np.fmin.reduce(d, axis=None))  # fmin skips NaN like the scalar `d < m` did
+    return 0.0 if m == float("inf") or m != m else m
+
+
+def auction_assign(
+    agents_xy: List[Vec2], goals_xy: List[Vec2], method: str = "hungarian"
+) -> List[Tuple[int, int]]:
+    """Match agents to goals, one goal per agent.
+
+    method="hungarian" solves the min total-distance assignment with SciPy's
+    linear_sum_assignment (pairs ordered by agent); method="auction" is the greedy
+    market-based pass that iteratively matches the closest free (agent, goal).
+    Without SciPy the auction is used.
+    """
+    if method not in ("hungarian", "auction"):
+        raise ValueError(f"unknown assignment method: {method!r}")
+    n = min(len(agents_xy), len(goals_xy))
+    if n == 0:
+        return []
+    A = np.asarray(agents_xy, dtype=float).reshape(-1, 2)
+    G = np.asarray(goals_xy, dtype=float).reshape(-1, 2)
+    # squared-distance cost matrix, built once
+    C = ((A[:, None, :] - G[None, :, :]) ** 2).sum(-1)
+    if method == "hungarian" and linear_sum_assignment is not None:
+        rows, cols = linear_sum_assignment(np.sqrt(C))
+        return [(int(i), int(j)) for i, j in zip(rows, cols)]
     pairs: List[Tuple[int, int]] = []
-    while A and G:
-        best = None
-        best_cost = 1e18
-        for i in A:
-            ax, ay = agents_xy[i]
-            for j in G:
-                gx, gy = goals_xy[j]
-                c = (ax - gx) ** 2 + (ay - gy) ** 2
-                if c < best_cost:
-                    best_cost = c
-                    best = (i, j)
-        i, j = best  # type: ignore
+    for _ in range(n):
+        # argmin returns the first minimum in row-major order, i.e. ties go to the
+        # lowest (agent, goal) index just like the original nested scan; matched
+        # rows/cols are masked out
+        i, j = divmod(int(np.argmin(C)), C.shape[1])
         pairs.append((i, j))
-        A.remove(i)
-        G.remove(j)
+        C[i, :] = np.inf
+        C[:, j] = np.inf
     return pairs
@@ -1,6 +1,218 @@
+import contextlib
+import importlib
+import io
+import json
+import multiprocessing
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+# orjson is optional: a faster parser for the artifact JSONs, stdlib json otherwise.
+try:
+    from orjson import loads as json_loads  # type: ignore
+except Exception:
+    json_loads = json.loads
 
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
+
+
+SCHEMA_V1 = Path(ROOT, "datasets/schema_v1.json")
+DEMO_PLAN = Path(ROOT, "simulation/missions/v1.0/waypoints_demo.plan")
+
+
+def run_main(module: str, *args: str) -> str:
+    """In-process `python -m module args...` via its main(argv); returns captured stdout.
+
+    Imports are paid once per session instead of once per interpreter spawn.
+    """
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        rc = importlib.import_module(module).main(list(args))
+    assert rc in (None, 0), f"{module} exited with {rc}"
+    return out.getvalue().strip()
+
+
+def _load_json(path: str | Path) -> dict:
+    assert os.path.isfile(path), f"missing artifact: {path}"
+    return json_loads(Path(path).read_bytes())
+
+
+@pytest.fixture(scope="session")
+def run_module():
+    return run_main
+
+
+# Artifact-producing scripts whose outputs (intermediates included) no other script
+# writes, so they can run alongside the tests; keyed by the fixture that serves them:
+# (module, argv, output file). The planner sweep shares compare_planners' CSVs, so its
+# test runs it inline instead.
+ARTIFACT_JOBS: dict[str, tuple[str, tuple[str, ...], str]] = {
+    "fw_metrics": ("scripts.fixedwing.run_fw_demo", (), "artifacts/fixedwing/fw_metrics.json"),
+    "hil_metrics": ("hil.scripts.start_hil_session", (), "artifacts/hil/session_metrics.json"),
+    # fewer episodes for CI speed, but still converges
+    "rl_summary": ("scripts.rl.train_grid", ("--episodes", "250"), "artifacts/rl/summary.json"),
+    # deterministic seed / fewer seconds for CI speed
+    "sysid_params": (
+        "scripts.sysid.estimate_quad2d",
+        ("--T", "10.0", "--dt", "0.02", "--seed", "11"),
+        "artifacts/sysid/est_params.json",
+    ),
+    "training_artifacts": (
+        "scripts.training.train_dummy",
+        ("--config", "configs/training/dummy.yaml"),
+        "artifacts/training/summary.json",
+    ),
+}
+
+
+@pytest.fixture(scope="session")
+def artifact_jobs(request):
+    """name -> Future of its ARTIFACT_JOBS run, for the artifacts this session needs.
+
+    Only jobs behind a fixture some collected test uses are started, all at once on
+    a shared pool (spawned workers: forking after numba has started its threads can
+    deadlock), so a selected subset pays only for its own scripts. Each artifact
+    fixture waits on its own future, so one failing script errors only its tests.
+    """
+    needed = [
+        name
+        for name in ARTIFACT_JOBS
+        if any(name in item.fixturenames for item in request.session.items)
+    ]
+    if not needed:
+        yield {}
+        return
+    workers = min(len(needed), os.cpu_count() or 1)
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        jobs = {}
+        for name in needed:
+            module, argv, out = ARTIFACT_JOBS[name]
+            # Clean prior output to avoid false positives
+            Path(out).unlink(missing_ok=True)
+            jobs[name] = pool.submit(run_main, module, *argv)
+        yield jobs
+
+
+def _artifact(jobs: dict, name: str) -> Path:
+    jobs[name].result()  # re-raises the script's exception in this fixture only
+    return Path(ARTIFACT_JOBS[name][2])
+
+
+@pytest.fixture(scope="session")
+def fw_metrics(artifact_jobs) -> dict:
+    return _load_json(_artifact(artifact_jobs, "fw_metrics"))
+
+
+@pytest.fixture(scope="session")
+def hil_metrics(artifact_jobs) -> dict:
+    return _load_json(_artifact(artifact_jobs, "hil_metrics"))
+
+
+@pytest.fixture(scope="session")
+def rl_summary(artifact_jobs) -> dict:
+    return _load_json(_artifact(artifact_jobs, "rl_summary"))
+
+
+@pytest.fixture(scope="session")
+def sysid_params(artifact_jobs) -> dict:
+    return _load_json(_artifact(artifact_jobs, "sysid_params"))
+
+
+@pytest.fixture(scope="session")
+def training_artifacts(artifact_jobs) -> Path:
+    return _artifact(artifact_jobs, "training_artifacts").parent
+
+
+@pytest.fixture(scope="session")
+def waypoint_ekf_csv() -> Path:
+    out_csv = Path("artifacts") / "waypoint_run_ekf.csv"
+    # Clean prior output to avoid false positives
+    out_csv.unlink(missing_ok=True)
+    out_csv.parent.mkdir(exist_ok=True)
+    # tiny sim (2s) so CI stays quick
+    run_main(
+        "scripts.run_waypoint_demo_ekf",
+        "--sim-seconds",
+        "2.0",
+        "--dt",
+        "0.02",
+        "--wp-radius",
+        "0.5",
+    )
+    return out_csv
+
+
+@pytest.fixture(scope="session")
+def waypoint_kpis(tmp_path_factory) -> dict:
+    """KPI report of one short waypoint demo, shared by every KPI assertion."""
+    out = tmp_path_factory.mktemp("waypoint_kpis")
+    run_csv, kpi_json = out / "waypoint_run.csv", out / "kpis.json"
+    # Generate a very short run so CI stays quick
+    run_main(
+        "scripts.run_waypoint_demo",
+        "--sim-seconds",
+        "2.0",
+        "--dt",
+        "0.05",
+        "--wp-radius",
+        "0.5",
+        "--csv-out",
+        str(run_csv),
+    )
+    run_main(
+        "scripts.evaluation.waypoint_kpi_report", "--csv", str(run_csv), "--json-out", str(kpi_json)
+    )
+    return _load_json(kpi_json)
+
+
+@pytest.fixture(scope="session")
+def randomization_profile():
+    """Factory: randomization_profile(seed) -> profile dict, one script run per seed.
+
+    The script always overwrites last_profile.json, so each seed's profile is
+    parsed right after its run and memoized.
+    """
+    cache: dict[int, dict] = {}
+
+    def get(seed: int) -> dict:
+        if seed not in cache:
+            run_main(
+                "simulation.domain_randomization.scripts.apply_randomization",
+                "--seed",
+                str(seed),
+            )
+            cache[seed] = _load_json("artifacts/randomization/last_profile.json")
+        return cache[seed]
+
+    return get
+
+
+# Shared read-only inputs, parsed once per session.
+
+
+@pytest.fixture(scope="session")
+def schema_v1() -> dict:
+    assert SCHEMA_V1.exists(), "datasets/schema_v1.json missing"
+    return _load_json(SCHEMA_V1)
+
+
+@pytest.fixture(scope="session")
+def demo_plan() -> dict:
+    # regenerate to ensure deterministic output
+    run_main("scripts.tools.gen_demo_plan", "--out", str(DEMO_PLAN), "--write-sha")
+    return _load_json(DEMO_PLAN)
+
+
+@pytest.fixture(scope="session")
+def mlflow_client():
+    # imported here so the rest of the suite does not need mlflow installed
+    import mlflow
+    from mlflow.tracking import MlflowClient
+
+    mlflow.set_tracking_uri("file:./mlruns")
+    return MlflowClient()
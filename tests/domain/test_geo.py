@@ -1,16 +1,43 @@
 import numpy as np
 
-from src.domain.geo import line_of_sight_free, point_in_polygon
+from src.domain.geo import (
+    Geofence,
+    line_of_sight_free,
+    point_in_polygon,
+    point_in_polygon_many,
+)
 
 
 def test_geofence_point_in_polygon():
     poly = [(5, 5), (35, 5), (35, 35), (5, 35)]
     assert point_in_polygon((10, 10), poly)
     assert not point_in_polygon((1, 1), poly)
+    verts = np.asarray(poly, dtype=np.float64)  # prebuilt: passed through uncopied
+    assert point_in_polygon((10, 10), verts)
+    assert not point_in_polygon((1, 1), verts)
+
+
+def test_point_in_polygon_many_matches_scalar():
+    poly = [(0, 0), (10, 2), (4, 9), (7, 3), (1, 6)]  # non-convex
+    pts = [(x, y) for x in range(-1, 12) for y in range(-1, 11)]
+    got = point_in_polygon_many(pts, poly)
+    assert got.tolist() == [point_in_polygon(p, poly) for p in pts]
+
+
+def test_geofence_tiles_match_ray_cast():
+    poly = [(0, 0), (10, 2), (4, 9), (7, 3), (1, 6)]
+    fence = Geofence(poly, granularity=4)
+    # integer points include vertices and points on edges
+    pts = [(x, y) for x in range(-1, 12) for y in range(-1, 11)]
+    pts += [(x + 0.37, y + 0.61) for x, y in pts]
+    assert [fence.inside(p) for p in pts] == [point_in_polygon(p, poly) for p in pts]
 
 
 def test_line_of_sight_on_grid():
-    grid = np.zeros((40, 40), dtype=int)
+    grid = np.zeros((40, 40), dtype=np.uint8)
     grid[20, 10:30] = 1  # wall at y=20
     assert line_of_sight_free((8, 8), (32, 8), grid)  # above wall -> free
     assert not line_of_sight_free((8, 20), (32, 20), grid)  # through wall -> blocked
+    rows = grid.tolist()  # list-of-lists grids take the plain Bresenham walk
+    assert line_of_sight_free((8, 8), (32, 8), rows)
+    assert not line_of_sight_free((8, 20), (32, 20), rows)
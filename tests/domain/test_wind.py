@@ -1,3 +1,5 @@
+import numpy as np
+
 from src.domain.wind import OUParams, WindField
 
 
@@ -6,15 +8,23 @@ def test_wind_stats_and_repeatability():
     wf2 = WindField(OUParams(tau_s=2.0, sigma=1.5), OUParams(tau_s=3.0, sigma=0.8), seed=7)
     dt = 0.05
     N = 400
-    s1 = []
-    s2 = []
-    for _ in range(N):
-        s1.append(wf1.sample(dt))
-        s2.append(wf2.sample(dt))
-    # same seed => identical sequences
-    assert s1 == s2
+    # same seed => identical sequences, for the online and the batched sampler
+    s1 = np.array([wf1.sample(dt) for _ in range(N)])
+    assert (s1 == np.array([wf2.sample(dt) for _ in range(N)])).all()
+    b1 = wf1.sample_trajectory(N, dt)
+    assert (b1 == wf2.sample_trajectory(N, dt)).all()
     # variance roughly near sigma^2 (loose check)
-    xs = [v[0] for v in s1]
-    mean = sum(xs) / len(xs)
-    var = sum((x - mean) ** 2 for x in xs) / len(xs)
-    assert 0.5 < var < 4.0
+    assert 0.5 < s1[:, 0].var() < 4.0
+    assert 0.5 < b1[:, 0].var() < 4.0
+
+
+def test_sample_trajectory_batch():
+    wf1 = WindField(OUParams(tau_s=2.0, sigma=1.5), OUParams(tau_s=3.0, sigma=0.8), seed=7)
+    wf2 = WindField(OUParams(tau_s=2.0, sigma=1.5), OUParams(tau_s=3.0, sigma=0.8), seed=7)
+    tr = wf1.sample_trajectory(4000, 0.05)
+    assert tr.shape == (4000, 3)
+    assert (tr == wf2.sample_trajectory(4000, 0.05)).all()
+    # axis states continue from the last row
+    assert (wf1.wx.state, wf1.wy.state, wf1.wz.state) == tuple(tr[-1])
+    assert 0.5 < tr[:, 0].var() < 4.0
+    assert 0.1 < tr[:, 2].var() < 1.5
@@ -1,48 +1,65 @@
 import csv
-import math
 import os
 
 import numpy as np
+from numpy.lib.recfunctions import structured_to_unstructured
 
 REQ_COLS = {"t", "x", "y", "z", "vx", "vy", "vz", "lat", "lon", "rel_alt_m"}
 
 
-def _load_csv(path):
+def _first_row(path):
+    """Header-keyed first data row, or None if the file is missing or has no rows."""
     if not os.path.isfile(path):
-        return []
-    with open(path) as f:
-        r = csv.DictReader(f)
-        return list(r)
+        return None
+    with open(path, newline="") as f:
+        return next(csv.DictReader(f), None)
+
+
+def _load_cols(path, cols):
+    """Structured float64 array with fields `cols`, or None if the file is missing.
+
+    Empty CSV fields are masked, so `arr[c].count()` is the number of filled entries.
+    """
+    if not os.path.isfile(path):
+        return None
+    return np.genfromtxt(
+        path,
+        delimiter=",",
+        names=True,
+        usecols=cols,
+        dtype=np.float64,
+        usemask=True,
+        ndmin=1,
+    )
 
 
 def test_ekf_outputs_exist_and_clean():
-    ekf_rows = _load_csv("artifacts/waypoint_run_ekf.csv")
-    raw_rows = _load_csv("artifacts/waypoint_run.csv")
-    assert raw_rows, "missing artifacts/waypoint_run.csv"
-    assert ekf_rows, "missing artifacts/waypoint_run_ekf.csv"
-    assert REQ_COLS.issubset(set(ekf_rows[0].keys()))
-    xs = [float(d["x"]) for d in ekf_rows if d["x"]]
-    ys = [float(d["y"]) for d in ekf_rows if d["y"]]
-    zs = [float(d["z"]) for d in ekf_rows if d["z"]]
-    assert len(xs) >= 10 and len(ys) >= 10 and len(zs) >= 10
-    assert all(math.isfinite(v) for v in xs + ys + zs)
+    ekf_csv = "artifacts/waypoint_run_ekf.csv"
+    assert _first_row("artifacts/waypoint_run.csv"), "missing artifacts/waypoint_run.csv"
+    ekf_row = _first_row(ekf_csv)
+    assert ekf_row, "missing artifacts/waypoint_run_ekf.csv"
+    assert REQ_COLS.issubset(set(ekf_row.keys()))
+    xyz = _load_cols(ekf_csv, ("x", "y", "z"))
+    for c in xyz.dtype.names:
+        # non-empty entries per column, all of them finite
+        assert xyz[c].count() >= 10
+        assert np.isfinite(xyz[c].compressed()).all()
 
 
 def test_ekf_motion_or_stability():
-    ekf_rows = _load_csv("artifacts/waypoint_run_ekf.csv")
-    xs = np.array([float(d["x"]) for d in ekf_rows])
-    ys = np.array([float(d["y"]) for d in ekf_rows])
-    zs = np.array([float(d["z"]) for d in ekf_rows])
-    vxs = np.array([float(d["vx"]) for d in ekf_rows])
-    vys = np.array([float(d["vy"]) for d in ekf_rows])
-    vzs = np.array([float(d["vz"]) for d in ekf_rows])
+    arr = _load_cols("artifacts/waypoint_run_ekf.csv", ("x", "y", "z", "vx", "vy", "vz"))
+    assert arr is not None, "missing artifacts/waypoint_run_ekf.csv"
+    # one (N, 6) float64 matrix; pos/vel are column views of it
+    m = structured_to_unstructured(arr.filled(np.nan))
+    pos, vel = m[:, :3], m[:, 3:]
 
     # 3D path length
-    dist3d = float(np.sum(np.sqrt(np.diff(xs) ** 2 + np.diff(ys) ** 2 + np.diff(zs) ** 2)))
+    d = np.diff(pos, axis=0)
+    dist3d = float(np.linalg.norm(d, axis=1).sum())
     # vertical displacement proxy
-    dz = float(np.sum(np.abs(np.diff(zs))))
-    # max speed
-    vmax = float(np.max(np.sqrt(vxs**2 + vys**2 + vzs**2)))
+    dz = float(np.abs(d[:, 2]).sum())
+    # max speed (one sqrt of the largest squared norm)
+    vmax = float(np.sqrt(np.einsum("ij,ij->i", vel, vel).max()))
 
     # Pass if there is meaningful motion (hover climbs etc.)
     if (dist3d > 0.5) or (dz > 0.5):
@@ -51,6 +68,6 @@ def test_ekf_motion_or_stability():
         return
 
     # Otherwise treat as static hover: require stability (no explosions)
-    assert np.all(np.isfinite(vxs)) and np.all(np.isfinite(vys)) and np.all(np.isfinite(vzs))
+    assert np.isfinite(vel).all()
     # velocities should remain near zero in static hover
     assert vmax < 0.5, f"static run but vmax too high: {vmax:.3f} m/s"
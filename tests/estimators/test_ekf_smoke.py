@@ -12,3 +12,35 @@ def test_shapes_and_stability():
     # diagonals positive, finite
     assert np.all(np.isfinite(st.x))
     assert np.all(np.diag(st.P) > 0)
+
+
+def test_block_updates_match_dense_equations():
+    ekf = EKFCV(dtype=np.float64)
+    st = ekf.init(1.0, -2.0, 3.0)
+    st.x[3:, 0] = (0.5, -0.25, 0.1)
+    x, P = st.x.copy(), st.P.copy()
+    H = np.hstack([np.eye(3), np.zeros((3, 3))])
+    R = np.eye(3) * ekf.r_pos
+    for dt, z in ((0.1, (1.2, -1.9, 3.1)), (0.25, (1.1, -2.2, 2.8))):
+        F = ekf._F(dt)
+        x = F @ x
+        P = F @ P @ F.T + ekf._Q(dt)
+        K = P @ H.T @ np.linalg.inv(H @ P @ H.T + R)
+        x = x + K @ (np.array(z).reshape(3, 1) - H @ x)
+        P = (np.eye(6) - K @ H) @ P
+
+        st = ekf.update_pos(ekf.predict(st, dt), *z)
+        assert np.allclose(st.x, x) and np.allclose(st.P, P)
+
+
+def test_float32_tracks_float64():
+    f32, f64 = EKFCV(), EKFCV(dtype=np.float64)
+    s32, s64 = f32.init(100.0, -50.0, 10.0), f64.init(100.0, -50.0, 10.0)
+    assert s32.x.dtype == np.float32 and s32.P.dtype == np.float32
+    rng = np.random.default_rng(0)
+    for k in range(200):
+        z = (100.0 + 0.5 * k + rng.normal(), -50.0 + rng.normal(), 10.0 + rng.normal())
+        s32 = f32.update_pos(f32.predict(s32, 0.1), *z)
+        s64 = f64.update_pos(f64.predict(s64, 0.1), *z)
+    assert s32.x.dtype == np.float32
+    assert np.allclose(s32.x, s64.x, atol=1e-3) and np.allclose(s32.P, s64.P, atol=1e-3)
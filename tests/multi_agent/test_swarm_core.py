@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from src.multi_agent.swarm import auction_assign, min_pairwise_distance, simulate_swarm
 
@@ -30,10 +31,22 @@ def test_formation_and_separation():
     assert min_pairwise_distance(tr) >= 0.30
 
 
-def test_auction_unique_pairs():
+@pytest.mark.parametrize("method", ["auction", "hungarian"])
+def test_auction_unique_pairs(method):
+    if method == "hungarian":
+        pytest.importorskip("scipy")  # without SciPy it silently runs the auction
     agents = [(0.0, 0.0), (5.0, 0.0), (10.0, 0.0)]
     goals = [(0.5, 0.0), (5.2, 0.0), (9.6, 0.0)]
-    pairs = auction_assign(agents, goals)
+    pairs = auction_assign(agents, goals, method=method)
     assert len(pairs) == 3
     assert len({i for i, j in pairs}) == 3
     assert len({j for i, j in pairs}) == 3
+
+
+def test_hungarian_minimizes_total_distance_where_greedy_does_not():
+    pytest.importorskip("scipy")
+    agents = [(0.0, 0.0), (2.2, 0.0)]
+    goals = [(1.0, 0.0), (-1.1, 0.0)]
+    # greedy takes the closest pair first (total 1.0 + 3.3); optimal is 1.1 + 1.2
+    assert auction_assign(agents, goals, method="auction") == [(0, 0), (1, 1)]
+    assert auction_assign(agents, goals, method="hungarian") == [(0, 1), (1, 0)]
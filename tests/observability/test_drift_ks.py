@@ -7,11 +7,10 @@ from observability.drift_detection.drift_ks import compare_csvs
 
 def _write_csv(path, cols):
     keys = list(cols)
-    with open(path, "w") as f:
-        f.write(",".join(keys) + "\n")
-        n = min(len(cols[k]) for k in keys)
-        for i in range(n):
-            f.write(",".join(str(cols[k][i]) for k in keys) + "\n")
+    n = min(len(cols[k]) for k in keys)
+    arr = np.column_stack([np.asarray(cols[k])[:n] for k in keys])
+    # %.17g round-trips float64 exactly, like the str() it replaces
+    np.savetxt(path, arr, delimiter=",", header=",".join(keys), comments="", fmt="%.17g")
 
 
 def test_ks_detects_distribution_shift(tmp_path):
@@ -1,31 +1,5 @@
-import json
-import os
-import subprocess
-import sys
-
-OUT_JSON = "artifacts/sysid/est_params.json"
-
-
-def _run(cmd):
-    return subprocess.run(cmd, check=True, capture_output=True, text=True)
-
-
-def test_sysid_recovers_params_reasonably():
-    # deterministic seed / fewer seconds for CI speed
-    _run(
-        [
-            sys.executable,
-            "scripts/sysid/estimate_quad2d.py",
-            "--T",
-            "10.0",
-            "--dt",
-            "0.02",
-            "--seed",
-            "11",
-        ]
-    )
-    assert os.path.isfile(OUT_JSON)
-    p = json.loads(open(OUT_JSON).read())
+def test_sysid_recovers_params_reasonably(sysid_params):
+    p = sysid_params
     m_true = p["true"]["m"]
     kx_true = p["true"]["kx"]
     ky_true = p["true"]["ky"]
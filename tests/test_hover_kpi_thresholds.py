@@ -12,12 +12,18 @@ def _make_hover_csv(path: Path, hz=50, duration_s=10.0, alt_m=1.5, z_std=0.02, s
     rng = np.random.default_rng(seed)
     n = int(hz * duration_s)
     t = np.arange(n) / hz
-    z = alt_m + rng.normal(0.0, z_std, size=n)
+    # one draw for altitude noise and both random-walk increments
+    r = rng.standard_normal((n, 3))
+    z = alt_m + z_std * r[:, 0]
     step = z_std / np.sqrt(hz)
-    x = np.cumsum(rng.normal(0.0, step, size=n))
-    y = np.cumsum(rng.normal(0.0, step, size=n))
-    pd.DataFrame({"time_s": t, "rel_alt_m": z, "pos_x_m": x, "pos_y_m": y}).to_csv(
-        path, index=False
+    xy = np.cumsum(step * r[:, 1:], axis=0)
+    np.savetxt(
+        path,
+        np.column_stack([t, z, xy]),
+        delimiter=",",
+        header="time_s,rel_alt_m,pos_x_m,pos_y_m",
+        comments="",
+        fmt="%.9g",
     )
 
 
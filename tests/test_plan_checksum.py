@@ -1,19 +1,28 @@
 import hashlib
+import mmap
+import os
 import pathlib
 
 PLAN = pathlib.Path("simulation/missions/v1.0/waypoints_demo.plan")
 SUMF = PLAN.with_suffix(PLAN.suffix + ".sha256")
 
 
-def _sha256_bytes(b: bytes) -> str:
-    h = hashlib.sha256()
-    h.update(b)
-    return h.hexdigest()
+def _sha256_file(path: pathlib.Path) -> str:
+    with path.open("rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        # CI still runs 3.10: hash straight from the page cache via mmap
+        # (mmap rejects empty files, which hash as b"")
+        h = hashlib.sha256()
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+        return h.hexdigest()
 
 
 def test_plan_checksum_matches_fixture():
     assert PLAN.exists(), "plan file is missing"
     assert SUMF.exists(), "checksum file is missing (run plan_demo to regenerate)"
     want = SUMF.read_text().strip().split()[0]
-    got = _sha256_bytes(PLAN.read_bytes())
+    got = _sha256_file(PLAN)
     assert got == want, f"SHA256 changed: expected {want}, got {got}"
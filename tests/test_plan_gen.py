@@ -1,16 +1,5 @@
-import json
-import pathlib
-import subprocess
-
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-GEN = ROOT / "scripts/tools/gen_demo_plan.py"
-PLAN = ROOT / "simulation/missions/v1.0/waypoints_demo.plan"
-
-
-def test_gen_demo_plan_structure():
-    # regenerate to ensure deterministic output
-    subprocess.check_call(["python3", str(GEN), "--write-sha"])
-    d = json.loads(PLAN.read_text())
+def test_gen_demo_plan_structure(demo_plan):
+    d = demo_plan
     assert d["fileType"] == "Plan"
     assert d["mission"]["version"] >= 2
     items = d["mission"]["items"]
@@ -1,13 +1,5 @@
-import json
-import pathlib
-
-SCHEMA = pathlib.Path("datasets/schema_v1.json")
-
-
-def test_schema_exists_and_has_expected_columns():
-    assert SCHEMA.exists(), "datasets/schema_v1.json missing"
-    schema = json.loads(SCHEMA.read_text())
-    cols = [c["name"] for c in schema["columns"]]
+def test_schema_exists_and_has_expected_columns(schema_v1):
+    cols = [c["name"] for c in schema_v1["columns"]]
     for required in [
         "t",
         "lat",
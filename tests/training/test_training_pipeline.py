@@ -1,27 +1,26 @@
-import csv
 import os
 
+import pandas as pd
+
 METRICS = "artifacts/training/metrics.csv"
 MODEL = "artifacts/training/model_dummy.npz"
 SUMMARY = "artifacts/training/summary.json"
 
 
-def _rows(path):
-    with open(path) as f:
-        return list(csv.DictReader(f))
+def _metrics(path):
+    # usecols raises if either column is missing from the header
+    return pd.read_csv(path, usecols=["loss", "acc"])
 
 
-def test_outputs_exist_and_nonempty():
+def test_outputs_exist_and_nonempty(training_artifacts):
     assert os.path.isfile(MODEL), "run trainer first"
     assert os.path.isfile(METRICS), "run trainer first"
-    rows = _rows(METRICS)
-    assert len(rows) >= 5
-    assert all("loss" in r and "acc" in r for r in rows)
+    df = _metrics(METRICS)
+    assert len(df) >= 5
 
 
-def test_loss_decreases_and_acc_is_reasonable():
-    rows = _rows(METRICS)
-    losses = [float(r["loss"]) for r in rows]
-    accs = [float(r["acc"]) for r in rows]
-    assert losses[-1] < losses[0] * 0.9  # at least 10% better
-    assert accs[-1] >= 0.80  # linearly separable -> should be high
+def test_loss_decreases_and_acc_is_reasonable(training_artifacts):
+    df = _metrics(METRICS)
+    loss, acc = df["loss"], df["acc"]
+    assert loss.iloc[-1] < loss.iloc[0] * 0.9  # at least 10% better
+    assert acc.iloc[-1] >= 0.80  # linearly separable -> should be high
@@ -1,5 +1,7 @@
 import random
 
+import numpy as np
+
 from sim.ekf_2d import EKF2D, EKFParams
 
 
@@ -9,20 +11,35 @@ def test_ekf_tracks_constant_accel():
     ekf.reset()
 
     # True motion: ax=0.5, ay=-0.2; noisy position measurements
-    px = py = vx = vy = 0.0
     ax, ay = 0.5, -0.2
-    rng = random.Random(123)
-
-    for k in range(int(5.0 / dt)):
-        # propagate truth
-        vx += ax * dt
-        vy += ay * dt
-        px += vx * dt
-        py += vy * dt
+    n = int(5.0 / dt)
+    # truth propagated as v += a dt; p += v dt, i.e. two cumulative sums
+    truth = np.cumsum(np.cumsum(np.tile([ax * dt, ay * dt], (n, 1)), axis=0) * dt, axis=0)
+    z = truth + np.random.default_rng(123).normal(0.0, 0.25, (n, 2))
 
-        zpx = px + rng.gauss(0.0, 0.25)
-        zpy = py + rng.gauss(0.0, 0.25)
+    for zpx, zpy in z.tolist():
         ekf_px, ekf_py, _, _ = ekf.step(ax, ay, zpx, zpy)
 
+    px, py = truth[-1]
     err = ((ekf_px - px) ** 2 + (ekf_py - py) ** 2) ** 0.5
     assert err < 0.2
+
+
+def test_ekf_step_kernel_matches_predict_update():
+    from sim.ekf_2d import ekf2d_step_jit
+
+    dt = 0.02
+    ref = EKF2D(dt)
+    fast = EKF2D(dt)
+    rng = random.Random(7)
+    for k in range(200):
+        ax, ay = rng.uniform(-1, 1), rng.uniform(-1, 1)
+        meas = k % 3 != 0
+        zpx, zpy = rng.gauss(0.0, 0.3), rng.gauss(0.0, 0.3)
+        ref.predict(ax, ay)
+        if meas:
+            ref.update(zpx, zpy)
+        ekf2d_step_jit(fast.x, fast.P, dt, fast.Q, fast.R, ax, ay, zpx, zpy, meas)
+
+    assert np.allclose(fast.x, ref.x, atol=1e-9)
+    assert np.allclose(fast.P, ref.P, atol=1e-9)
@@ -6,6 +6,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).resolve().parents[2] / "src"))
 
 from controllers.lqr.lqr_position import Limits, LQRGains, LQRPos2D  # noqa: E402
+from sim.control_kernels import simulate_lqr_step_move  # noqa: E402
 
 
 def test_zero_error_zero_output():
@@ -14,18 +15,26 @@ def test_zero_error_zero_output():
     assert abs(ax) < 1e-9 and abs(ay) < 1e-9
 
 
-def test_step_move_converges_simple_kinematics():
+def test_simulate_lqr_step_move_matches_class_loop():
     ctrl = LQRPos2D(LQRGains(2.0, 3.5, 0.1), limits=Limits(accel_max=3.0, i_limit=0.5))
     dt = 0.02
     pos = [0.0, 0.0]
     vel = [0.0, 0.0]
-    target = (10.0, 10.0)
-    for _ in range(int(5.0 / dt)):
-        ax, ay = ctrl.step(dt, tuple(pos), tuple(vel), target)
+    for _ in range(40):
+        ax, ay = ctrl.step(dt, tuple(pos), tuple(vel), (10.0, 10.0))
         vel[0] += ax * dt
         vel[1] += ay * dt
         pos[0] += vel[0] * dt
         pos[1] += vel[1] * dt
-    ex = target[0] - pos[0]
-    ey = target[1] - pos[1]
+    got = simulate_lqr_step_move(2.0, 3.5, 0.1, 0.5, 3.0, dt, 40, 10.0, 10.0)
+    assert got == (pos[0], pos[1], vel[0], vel[1])
+
+
+def test_step_move_converges_simple_kinematics():
+    # jitted rollout of the same law, pinned to LQRPos2D by the test above
+    dt = 0.02
+    target = (10.0, 10.0)
+    px, py, _, _ = simulate_lqr_step_move(2.0, 3.5, 0.1, 0.5, 3.0, dt, int(5.0 / dt), *target)
+    ex = target[0] - px
+    ey = target[1] - py
     assert math.hypot(ex, ey) < 1.0
@@ -1,4 +1,5 @@
 from control.pid_pos import Limits, PIDGains, PIDPos2D
+from sim.control_kernels import simulate_pid_step_move
 
 
 def test_zero_error_zero_output():
@@ -13,22 +14,29 @@ def test_zero_error_zero_output():
     assert abs(ax) < 1e-9 and abs(ay) < 1e-9
 
 
-def test_step_move_converges_simple_kinematics():
+def test_simulate_pid_step_move_matches_class_loop():
     ctrl = PIDPos2D(PIDGains(0.6, 0.02, 0.8), limits=Limits(accel_max=2.0, i_limit=0.8))
     dt = 0.02
     pos = [0.0, 0.0]
     vel = [0.0, 0.0]
-    target = (1.0, 1.0)
-
-    for _ in range(int(3.0 / dt)):
-        ax, ay = ctrl.step(dt, tuple(pos), tuple(vel), target)
+    for _ in range(40):
+        ax, ay = ctrl.step(dt, tuple(pos), tuple(vel), (1.0, 1.0))
         vel[0] += ax * dt
         vel[1] += ay * dt
         pos[0] += vel[0] * dt
         pos[1] += vel[1] * dt
+    got = simulate_pid_step_move(0.6, 0.02, 0.8, 0.8, 2.0, dt, 40, 1.0, 1.0)
+    assert got == (pos[0], pos[1], vel[0], vel[1])
+
+
+def test_step_move_converges_simple_kinematics():
+    # jitted rollout of the same law, pinned to PIDPos2D by the test above
+    dt = 0.02
+    target = (1.0, 1.0)
+    px, py, _, _ = simulate_pid_step_move(0.6, 0.02, 0.8, 0.8, 2.0, dt, int(3.0 / dt), *target)
 
-    ex = target[0] - pos[0]
-    ey = target[1] - pos[1]
+    ex = target[0] - px
+    ey = target[1] - py
     assert (ex**2 + ey**2) ** 0.5 < 0.15  # within 15 cm after 3s
 
 
@@ -0,0 +1,21 @@
+import math
+
+from src.controllers.utils.pure_pursuit import PPConfig, PurePursuit2D
+
+
+def test_accel_points_at_waypoint_and_is_clamped():
+    pp = PurePursuit2D(PPConfig(desired_speed=4.0, accel_limit=3.0, vel_p=1.5))
+    ax, ay = pp.accel_cmd((0.0, 0.0), (0.0, 0.0), (10.0, 10.0))
+    assert math.isclose(math.hypot(ax, ay), 3.0)
+    assert math.isclose(ax, ay)
+    assert pp.accel_cmd((1.0, 1.0), (0.0, 0.0), (1.0, 1.0)) == (0.0, 0.0)
+
+
+def test_unclamped_accel_tracks_desired_velocity():
+    cfg = PPConfig(accel_limit=100.0)
+    pp = PurePursuit2D(cfg)
+    pos, vel, wp = (0.0, 0.0), (1.0, -0.5), (3.0, 4.0)
+    dvx, dvy = pp.desired_velocity(pos, wp)
+    assert math.isclose(math.hypot(dvx, dvy), cfg.desired_speed)
+    assert math.isclose(dvx * 4.0, dvy * 3.0)  # along the line to the waypoint
+    assert pp.accel_cmd(pos, vel, wp) == (cfg.vel_p * (dvx - vel[0]), cfg.vel_p * (dvy - vel[1]))
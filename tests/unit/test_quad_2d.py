@@ -1,12 +1,14 @@
-from sim.quad_2d import Quad2D, QuadParams
+import numpy as np
+import pytest
+
+from sim.quad_2d import Quad2D, Quad2DBatch, QuadParams, _rollout_no_drag
 
 
 def test_constant_accel_no_drag_matches_kinematics():
     dt, T = 0.01, 1.0
     steps = int(T / dt)
     q = Quad2D(QuadParams(drag=0.0, accel_max=10.0))
-    for _ in range(steps):
-        q.step(dt, 1.0, 0.0)  # 1 m/s^2 in x
+    q.rollout(dt, np.ones(steps), np.zeros(steps))  # 1 m/s^2 in x
     px, py, vx, vy = q.state()
     # x = 0.5 a t^2 ; v = a t
     assert abs(px - 0.5 * 1.0 * T * T) < 1e-2
@@ -14,12 +16,17 @@ def test_constant_accel_no_drag_matches_kinematics():
     assert abs(py) < 1e-9 and abs(vy) < 1e-9
 
 
-def test_drag_reduces_velocity_magnitude():
-    q = Quad2D(QuadParams(drag=1.0, accel_max=10.0))
-    q.reset(vx=1.0, vy=0.0)
-    q.step(0.1, 0.0, 0.0)  # no input; drag only
-    _, _, vx, _ = q.state()
-    assert vx < 1.0  # should decay
+# (30.0, 0.1): drag*dt > 1, where explicit Euler would overshoot through zero
+@pytest.mark.parametrize("drag,dt", [(0.5, 0.01), (1.0, 0.1), (2.0, 0.05), (30.0, 0.1)])
+def test_drag_matches_closed_form(drag, dt):
+    n = 50
+    q = Quad2D(QuadParams(drag=drag, accel_max=10.0))
+    q.reset(vx=1.0, vy=-0.5)
+    out = q.rollout(dt, np.zeros(n), np.zeros(n))  # no input; drag only
+    steps = np.arange(1, n + 1)
+    exact = Quad2DBatch.rollout_drag_only(np.array([[1.0], [-0.5]]), drag, dt, steps).T
+    np.testing.assert_allclose(out[:, 2:4], exact, rtol=1e-10, atol=0.0)
+    assert 0.0 < out[-1, 2] < 1.0  # decays without overshooting through zero
 
 
 def test_saturation_limits_accel_effect():
@@ -28,3 +35,41 @@ def test_saturation_limits_accel_effect():
     q.step(dt, 2.0, 0.0)  # command beyond limit
     _, _, vx, _ = q.state()
     assert vx <= 0.5 * dt + 1e-9
+
+
+def test_rollout_matches_step_loop():
+    rng = np.random.default_rng(3)
+    ax, ay = rng.uniform(-2.0, 2.0, (2, 60))
+    for drag in (0.0, 0.3):
+        q_ref = Quad2D(QuadParams(drag=drag, accel_max=1.0))
+        q_ref.reset(px=0.5, vy=-0.2)
+        ref = np.array([q_ref.step(0.05, a, b) for a, b in zip(ax, ay)])
+        q = Quad2D(QuadParams(drag=drag, accel_max=1.0))
+        q.reset(px=0.5, vy=-0.2)
+        assert np.array_equal(q.rollout(0.05, ax, ay), ref)
+        assert q.state() == q_ref.state()
+        if drag == 0.0:
+            # NumPy path taken when numba is missing
+            state = np.array([0.5, 0.0, 0.0, -0.2])
+            assert np.array_equal(_rollout_no_drag(state, 0.05, ax, ay, 1.0), ref)
+            assert tuple(state) == q_ref.state()
+
+
+# 6 quads take the NumPy row ops, 16 the parallel kernel (PARALLEL_MIN_QUADS = 8)
+@pytest.mark.parametrize("m", [6, 16])
+def test_batch_step_matches_single_quads(m):
+    params = QuadParams(drag=0.2, accel_max=1.5)
+    rng = np.random.default_rng(5)
+    batch = Quad2DBatch(m, params)
+    batch.state[:] = rng.normal(0.0, 1.0, (4, m))
+    quads = []
+    for px, py, vx, vy in batch.state.T:
+        q = Quad2D(params)
+        q.reset(px, py, vx, vy)
+        quads.append(q)
+    for _ in range(30):
+        ax, ay = rng.uniform(-3.0, 3.0, (2, m))
+        batch.step(0.05, ax, ay)
+        for q, a, b in zip(quads, ax, ay):
+            q.step(0.05, a, b)
+    assert np.array_equal(batch.state.T, np.array([q.state() for q in quads]))